@@ -38,6 +38,8 @@ from ui.themes.style_config import (
     SPACING,
 )
 from config.settings.py import DEFAULT_ICONS, REQUIRED_INTERNAL_COLUMNS
+from utils.helpers import enable_response_compression, cache_layout_response
+from ui.components.graph import register_graph_callbacks, register_graph_loading_trigger
 
 print("🚀 Starting Yōsai Enhanced Analytics Dashboard (FIXED VERSION)...")
 
@@ -129,6 +131,9 @@ for component, available in components_available.items():
 # FIXED LAYOUT CREATION - MAINTAINS CONSISTENCY + ADDS REQUIRED ELEMENTS
 # ============================================================================
 
+# Floor slider marks with JSON-ready string keys, built once
+FLOOR_SLIDER_MARKS = {**{str(i): str(i) for i in range(1, 20, 2)}, '48': '48'}
+
 def create_fixed_layout_with_required_elements(app_instance, main_logo_path, icon_upload_default):
     """Create layout that maintains current design but includes all required callback elements"""
     
@@ -283,6 +288,7 @@ def _add_missing_elements_to_existing_layout(base_layout, main_logo_path, icon_u
             'mini-graph-container': _create_mini_graph_container(),
             'onion-graph': None,  # Will be added to graph-output-container
             'mini-onion-graph': None,  # Will be added to mini-graph-container
+            'app-state': dcc.Store(id='app-state', storage_type='session'),
         }
         
         # Collect all IDs again after modifications
@@ -292,7 +298,7 @@ def _add_missing_elements_to_existing_layout(base_layout, main_logo_path, icon_u
         
         # Add missing required elements (hidden by default to maintain layout)
         for element_id, element_creator in required_elements.items():
-            if element_id not in existing_ids and element_creator:
+            if element_id not in existing_ids and element_creator is not None:
                 print(f">> Adding missing element: {element_id}")
                 base_children.append(element_creator)
         
@@ -332,7 +338,7 @@ def _add_missing_callback_elements(base_children, existing_ids):
         'export-charts-png', 'generate-pdf-report', 'refresh-analytics',
         'download-stats-csv', 'download-charts', 'download-report', 'export-status',
         'floor-slider-value', 'manual-map-toggle', 'door-classification-table-container',
-        'door-classification-table', 'floor-slider'
+        'door-classification-table', 'floor-slider', 'graph-spinner', 'graph-loading', 'expand-all-button'
     ]
     
     # Add missing elements as hidden placeholders
@@ -345,6 +351,8 @@ def _add_missing_callback_elements(base_children, existing_ids):
                 element = dcc.Graph(id=element_id, style={'display': 'none'})
             elif 'download' in element_id:
                 element = dcc.Download(id=element_id)
+            elif 'loading' in element_id:
+                element = dcc.Store(id=element_id, data=False)
             elif 'selector' in element_id or 'toggle' in element_id:
                 element = dcc.Dropdown(id=element_id, style={'display': 'none'})
             elif 'input' in element_id:
@@ -499,7 +507,7 @@ def _create_complete_fixed_layout(app_instance, main_logo_path, icon_upload_defa
                         dcc.Slider(
                             id="floor-slider",
                             min=1, max=48, step=1, value=48,
-                            marks={**{i: str(i) for i in range(1, 20, 2)}, 48: '48'}
+                            marks=FLOOR_SLIDER_MARKS
                         ),
                         html.Div(id="floor-slider-value", children="48 floors"),
                         html.Label("Enable manual door classification?"),
@@ -558,10 +566,8 @@ def _create_complete_fixed_layout(app_instance, main_logo_path, icon_upload_defa
         
         # Data stores
         dcc.Store(id='uploaded-file-store'),
-        dcc.Store(id='csv-headers-store', storage_type='session'),
-        dcc.Store(id='processed-data-store', storage_type='session'),
-        dcc.Store(id='enhanced-metrics-store', storage_type='session'),
-        dcc.Store(id='all-doors-from-csv-store', storage_type='session'),
+        dcc.Store(id='app-state', storage_type='session'),
+        dcc.Store(id='enhanced-metrics-store'),  # Recomputed on every generate
         
     ], style={
         'backgroundColor': COLORS['background'],
@@ -676,7 +682,10 @@ def _create_fallback_graph_container():
         style={'display': 'none'},
         children=[
             html.H2("Security Model Graph"),
+            html.Button(id='expand-all-button', style={'display': 'none'}),
             graph_element,
+            html.Div(id='graph-spinner', style={'display': 'none'}),
+            dcc.Store(id='graph-loading', data=False),
             html.Pre(id='tap-node-data-output', children="Graph interaction data will appear here")
         ]
     )
@@ -715,6 +724,9 @@ app = dash.Dash(
 server = app.server
 app.title = "Yōsai Enhanced Analytics Dashboard"
 
+if enable_response_compression(server):
+    print(">> Response compression enabled")
+
 # Asset paths
 ICON_UPLOAD_DEFAULT = app.get_asset_url('upload_file_csv_icon.png')
 ICON_UPLOAD_SUCCESS = app.get_asset_url('upload_file_csv_icon_success.png')
@@ -728,6 +740,12 @@ app.layout = create_fixed_layout_with_required_elements(app, MAIN_LOGO_PATH, ICO
 
 print(">> FIXED layout created successfully with all required callback elements")
 
+# The layout never changes after startup, so serialize it once
+if cache_layout_response(app):
+    print(">> Layout response cached")
+
+register_graph_callbacks(app)
+
 # ============================================================================
 # FIXED CALLBACKS - All outputs now have corresponding layout elements
 # ============================================================================
@@ -736,12 +754,10 @@ print(">> FIXED layout created successfully with all required callback elements"
 @app.callback(
     [
         Output('uploaded-file-store', 'data'),
-        Output('csv-headers-store', 'data'),
+        Output('app-state', 'data'),
         Output('processing-status', 'children'),
-        Output('all-doors-from-csv-store', 'data'),
         Output('interactive-setup-container', 'style'),
         Output('upload-data', 'style'),
-        Output('processed-data-store', 'data'),
         Output('upload-icon', 'src'),
     ],
     Input('upload-data', 'contents'),
@@ -752,7 +768,7 @@ def enhanced_file_upload(contents, filename):
     """Enhanced upload callback"""
     print(f">> Upload callback triggered: {filename}")
     if not contents:
-        return None, None, "", None, {'display': 'none'}, {}, None, ICON_UPLOAD_DEFAULT
+        return None, None, "", {'display': 'none'}, {}, ICON_UPLOAD_DEFAULT
     
     try:
         print(f">> Processing file: {filename}")
@@ -770,7 +786,7 @@ def enhanced_file_upload(contents, filename):
             return (
                 None, None,
                 "Error: Please upload a CSV or JSON file",
-                None, {'display': 'none'}, {}, None, ICON_UPLOAD_FAIL
+                {'display': 'none'}, {}, ICON_UPLOAD_FAIL
             )
 
         headers = df.columns.tolist()
@@ -792,14 +808,19 @@ def enhanced_file_upload(contents, filename):
             'upload_timestamp': pd.Timestamp.now().isoformat(),
         }
         
+        # One session store write instead of three separate ones
+        app_state = {
+            'csv_headers': headers,
+            'all_doors': doors,
+            'processed_data': processed_data,
+        }
+        
         print(">> Upload successful")
         return (
-            contents, headers,
+            contents, app_state,
             f"[SUCCESS] Uploaded: {filename} ({len(df):,} rows, {len(headers)} columns)",
-            doors,
             {'display': 'block'},
             {'borderColor': '#2DBE6C'},
-            processed_data,
             ICON_UPLOAD_SUCCESS,
         )
         
@@ -808,7 +829,7 @@ def enhanced_file_upload(contents, filename):
         return (
             None, None,
             f"[ERROR] Error processing {filename}: {str(e)}",
-            None, {'display': 'none'}, {}, None, ICON_UPLOAD_FAIL
+            {'display': 'none'}, {}, ICON_UPLOAD_FAIL
         )
 
 # 2. Mapping dropdowns callback
@@ -818,11 +839,12 @@ def enhanced_file_upload(contents, filename):
         Output('confirm-header-map-button', 'style'),
         Output('mapping-ui-section', 'style')
     ],
-    Input('csv-headers-store', 'data'),
+    Input('app-state', 'data'),
     prevent_initial_call=True
 )
-def create_mapping_dropdowns(headers):
+def create_mapping_dropdowns(app_state):
     """Create mapping dropdowns when CSV is uploaded"""
+    headers = (app_state or {}).get('csv_headers')
     print(f">> Mapping callback triggered with headers: {headers}")
     
     if not headers:
@@ -978,14 +1000,13 @@ def update_floor_display(value):
         Output('main-analytics-chart', 'figure'),
         Output('security-pie-chart', 'figure'),
         Output('heatmap-chart', 'figure'),
-        Output('enhanced-metrics-store', 'data')
+        Output('enhanced-metrics-store', 'data'),
+        Output('graph-loading', 'data', allow_duplicate=True)
     ],
     Input('confirm-and-generate-button', 'n_clicks'),
     [
         State('uploaded-file-store', 'data'),
-        State('processed-data-store', 'data'),
-        State('csv-headers-store', 'data'),
-        State('all-doors-from-csv-store', 'data'),
+        State('app-state', 'data'),
         State({'type': 'mapping-dropdown', 'index': ALL}, 'value'),
         State({'type': 'mapping-dropdown', 'index': ALL}, 'id'),
         State('floor-slider', 'value'),
@@ -993,9 +1014,13 @@ def update_floor_display(value):
     ],
     prevent_initial_call=True
 )
-def generate_comprehensive_analysis(n_clicks, file_data, processed_data, headers, doors, 
+def generate_comprehensive_analysis(n_clicks, file_data, app_state,
                                   mapping_values, mapping_ids, num_floors, manual_classification):
     """Generate comprehensive analysis"""
+    app_state = app_state or {}
+    processed_data = app_state.get('processed_data')
+    headers = app_state.get('csv_headers')
+    doors = app_state.get('all_doors')
     if not n_clicks or not file_data:
         # Return default values for all outputs
         hide_style = {'display': 'none'}
@@ -1020,7 +1045,8 @@ def generate_comprehensive_analysis(n_clicks, file_data, processed_data, headers
             'Peak: N/A', 'Busiest: N/A', 'Floor: N/A', 'Ratio: N/A', 'Pattern: N/A',  # advanced
             [html.P("No data")], 'Score: N/A', 'Alerts: 0',  # security breakdown
             empty_figure, empty_figure, empty_figure,  # charts
-            None  # metrics store
+            None,  # metrics store
+            False  # graph-loading
         )
     
     try:
@@ -1124,7 +1150,8 @@ def generate_comprehensive_analysis(n_clicks, file_data, processed_data, headers
                         'id': str(door),
                         'label': str(door)[:12],
                         'type': 'entrance' if i == 0 else 'regular'
-                    }
+                    },
+                    'classes': 'door entrance' if i == 0 else 'door'
                 })
                 if i > 0:
                     graph_elements.append({
@@ -1176,7 +1203,8 @@ def generate_comprehensive_analysis(n_clicks, file_data, processed_data, headers
             "1.2:1 (Entry:Exit)", "Weekday: 75% | Weekend: 25%",  # advanced
             security_breakdown, "92% Compliant", "2 alerts require attention",  # security
             hourly_chart, security_chart, heatmap_chart,  # charts
-            enhanced_metrics  # metrics store
+            enhanced_metrics,  # metrics store
+            False  # graph-loading
         )
         
     except Exception as e:
@@ -1206,9 +1234,13 @@ def generate_comprehensive_analysis(n_clicks, file_data, processed_data, headers
             'Error', 'Error', 'Error', 'Error', 'Error',  # advanced
             [html.P("Error")], 'Error', 'Error',  # security
             error_figure, error_figure, error_figure,  # charts
-            None  # metrics
+            None,  # metrics
+            False  # graph-loading
         )
 
+# Spinner for the rebuild above: set on click, cleared by generate_comprehensive_analysis
+register_graph_loading_trigger(app, 'confirm-and-generate-button')
+
 # 7. Export callback
 @app.callback(
     Output('export-status', 'children'),
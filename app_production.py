@@ -2,7 +2,6 @@
 import dash
 import sys
 import os
-from waitress import serve
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -19,9 +18,11 @@ from ui.components.classification_handlers import create_classification_handlers
 
 # Import layout
 from ui.pages.main_page import create_main_layout
+from ui.components.graph import register_graph_callbacks
 
 # Logging setup
 from utils.logging_config import setup_application_logging, get_logger
+from utils.helpers import enable_response_compression, cache_layout_response
 
 def create_production_app():
     """Create and configure the production Dash application"""
@@ -40,6 +41,9 @@ def create_production_app():
         external_stylesheets=[dbc.themes.DARKLY]
     )
     
+    if enable_response_compression(app.server):
+        logger.info("🗜️ Response compression enabled")
+    
     # Asset URLs
     ICON_UPLOAD_DEFAULT = app.get_asset_url('upload_file_csv_icon.png')
     ICON_UPLOAD_SUCCESS = app.get_asset_url('upload_file_csv_icon_success.png') 
@@ -67,10 +71,14 @@ def create_production_app():
 
     # Create main layout
     app.layout = create_main_layout(app)
+    register_graph_callbacks(app)
+    if cache_layout_response(app):
+        logger.info("📦 Layout response cached")
 
     logger.info("✅ Production app created successfully")
     return app
 
 if __name__ == "__main__":
+    from waitress import serve
     app = create_production_app()
     serve(app.server, host='0.0.0.0', port=8050)
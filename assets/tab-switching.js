@@ -0,0 +1,18 @@
+// assets/tab-switching.js - Browser-side tab switching for ui/pages/main_page.py
+
+// All three panes are pre-rendered, so a tab click only flips styles and
+// classNames; nothing goes to the server.
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    tabs: {
+        switchTab: function(n1, n2, n3) {
+            const ctx = window.dash_clientside.callback_context;
+            const active = ctx.triggered.length
+                ? ctx.triggered[0].prop_id.split('.')[0]
+                : 'tab-overview';
+            const tabs = ['tab-overview', 'tab-advanced', 'tab-export'];
+            const styles = tabs.map(t => t === active ? {} : {display: 'none'});
+            const classes = tabs.map(t => t === active ? 'tab active' : 'tab');
+            return styles.concat(classes);
+        }
+    }
+});
@@ -8,31 +8,40 @@ import os
 import re
 import sys
 
+# Patterns to look for
+CALLBACK_PATTERNS = [
+    r'@app\.callback',
+    r'@.*\.callback',
+    r'floor-slider-value',
+    r'num-floors-store',
+    r'Output.*floor-slider',
+    r'Input.*floor-slider',
+]
+_COMPILED_CALLBACK_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in CALLBACK_PATTERNS]
+# Any of the above in one alternation: one scan per file to find the lines worth checking
+CALLBACK_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in CALLBACK_PATTERNS), re.IGNORECASE)
+
+def iter_python_files(root='.'):
+    """Yield Python files under root in os.walk order, via one scandir per directory"""
+    stack = [root]
+    while stack:
+        subdirs = []
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    # Skip hidden directories and __pycache__
+                    if not entry.name.startswith('.') and entry.name != '__pycache__':
+                        subdirs.append(entry.path)
+                elif entry.name.endswith('.py'):
+                    yield entry.path
+        stack.extend(reversed(subdirs))
+
 def find_callback_registrations():
     """Find all callback registrations in the codebase"""
     print("🔍 Searching for callback registrations...")
     
-    # Files to search
-    search_files = []
-    
     # Find all Python files
-    for root, dirs, files in os.walk('.'):
-        # Skip hidden directories and __pycache__
-        dirs[:] = [d for d in dirs if not d.startswith('.') and d != '__pycache__']
-        
-        for file in files:
-            if file.endswith('.py'):
-                search_files.append(os.path.join(root, file))
-    
-    # Patterns to look for
-    callback_patterns = [
-        r'@app\.callback',
-        r'@.*\.callback',
-        r'floor-slider-value',
-        r'num-floors-store',
-        r'Output.*floor-slider',
-        r'Input.*floor-slider',
-    ]
+    search_files = list(iter_python_files('.'))
     
     findings = {}
     
@@ -40,18 +49,28 @@ def find_callback_registrations():
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
-                lines = content.split('\n')
+            
+            # Jump from one matching line to the next with the combined pattern; only
+            # those lines are checked against each pattern to label the findings
+            pos = counted = 0
+            line_number = 1
+            while (match := CALLBACK_RE.search(content, pos)) is not None:
+                start = content.rfind('\n', 0, match.start()) + 1
+                end = content.find('\n', match.start())
+                if end == -1:
+                    end = len(content)
+                line_number += content.count('\n', counted, start)
+                counted = start
+                line = content[start:end]
                 
-                for i, line in enumerate(lines, 1):
-                    for pattern in callback_patterns:
-                        if re.search(pattern, line, re.IGNORECASE):
-                            if file_path not in findings:
-                                findings[file_path] = []
-                            findings[file_path].append({
-                                'line': i,
-                                'content': line.strip(),
-                                'pattern': pattern
-                            })
+                for pattern, compiled in zip(CALLBACK_PATTERNS, _COMPILED_CALLBACK_PATTERNS):
+                    if compiled.search(line):
+                        findings.setdefault(file_path, []).append({
+                            'line': line_number,
+                            'content': line.strip(),
+                            'pattern': pattern
+                        })
+                pos = end + 1
         except Exception as e:
             print(f"⚠️ Could not read {file_path}: {e}")
     
@@ -5,7 +5,7 @@ logger = get_logger(__name__)
 
 # Assuming you have a constants file for display names as well
 # Make sure this import path is correct relative to your project structure
-from config.settings.py import REQUIRED_INTERNAL_COLUMNS
+from config.settings import REQUIRED_INTERNAL_COLUMNS
 
 # Define display names for clarity and consistency
 DOORID_COL_DISPLAY = REQUIRED_INTERNAL_COLUMNS['DoorID']        # 'DoorID (Device Name)'
@@ -13,6 +13,9 @@ TIMESTAMP_COL_DISPLAY = REQUIRED_INTERNAL_COLUMNS['Timestamp']  # 'Timestamp (Ev
 USERID_COL_DISPLAY = REQUIRED_INTERNAL_COLUMNS['UserID']        # 'UserID (Person Identifier)'
 EVENTTYPE_COL_DISPLAY = REQUIRED_INTERNAL_COLUMNS['EventType']  # 'EventType (Access Result)'
 
+# cytoscape.js stays responsive up to a few hundred rendered nodes
+MAX_RENDERED_NODES = 500
+
 
 def prepare_path_visualization_data(all_paths_df, source_col='SourceDoor',
                                     target_col='TargetDoor', frequency_col='TransitionFrequency'):
@@ -45,7 +48,9 @@ def prepare_path_visualization_data(all_paths_df, source_col='SourceDoor',
     return path_widths_df
 
 
-def prepare_cytoscape_elements(device_attributes_df, path_viz_data_df, all_paths_df=None, target_floor=None):
+def prepare_cytoscape_elements(device_attributes_df, path_viz_data_df, all_paths_df=None, target_floor=None,
+                               max_nodes=MAX_RENDERED_NODES):
+    """ Builds onion-graph nodes and edges; graphs over max_nodes come back coarsened (None disables). """
     logger.info("\nPreparing Cytoscape Elements (nodes and edges)...")
     nodes, edges = [], []
     
@@ -79,10 +84,13 @@ def prepare_cytoscape_elements(device_attributes_df, path_viz_data_df, all_paths
     if doorid_col in device_attributes_df.columns and 'MostCommonNextDoor' in device_attributes_df.columns:
         dev_mcn = device_attributes_df.set_index(doorid_col)['MostCommonNextDoor'].to_dict()
 
+    core_layer = None  # innermost onion layer, when there is more than one
     if not device_attributes_df.empty and 'FinalGlobalDeviceDepth' in device_attributes_df.columns:
         valid_layers_depths = device_attributes_df['FinalGlobalDeviceDepth'].dropna()
         valid_layers_depths = valid_layers_depths[valid_layers_depths > 0]
         unique_layer_depths = sorted(valid_layers_depths.unique())
+        if len(unique_layer_depths) > 1:
+            core_layer = int(unique_layer_depths[-1])
 
         for depth_val in unique_layer_depths:
             lv_int = int(depth_val)
@@ -96,8 +104,9 @@ def prepare_cytoscape_elements(device_attributes_df, path_viz_data_df, all_paths
                 elif len(layer_floors) > 1: 
                     floor_label_part = f" (Floors: {', '.join(sorted(layer_floors))})"
             layer_parent_label = f'Layer {lv_int}{floor_label_part}'
-            nodes.append({'data': {'id': f'layer_{lv_int}', 'label': layer_parent_label, 'is_layer_parent': True, 'layer_num': lv_int}})
+            nodes.append({'data': {'id': f'layer_{lv_int}', 'label': layer_parent_label, 'is_layer_parent': True, 'layer_num': lv_int}, 'classes': 'layer'})
 
+    door_data = {}
     for _, r in device_attributes_df.iterrows():
         if doorid_col in r and pd.notna(r.get('FinalGlobalDeviceDepth')) and r['FinalGlobalDeviceDepth'] > 0:
             l_assign = int(r['FinalGlobalDeviceDepth'])
@@ -116,7 +125,18 @@ def prepare_cytoscape_elements(device_attributes_df, path_viz_data_df, all_paths
             mcn_val = dev_mcn.get(r[doorid_col])
             if pd.notna(mcn_val): 
                 node_data['most_common_next'] = str(mcn_val)
-            nodes.append({'data': node_data})
+            # Class selectors are indexed by cytoscape.js; data selectors are not
+            node_classes = ['door']
+            if l_assign == core_layer:
+                node_classes.append('core')
+            if node_data['is_entrance']:
+                node_classes.append('entrance')
+            if node_data['is_critical']:
+                node_classes.append('critical')
+            if node_data['is_stair']:
+                node_classes.append('stair')
+            nodes.append({'data': node_data, 'classes': ' '.join(node_classes)})
+            door_data[door_id_str] = node_data
 
     if all_paths_df is not None and not all_paths_df.empty and 'SourceDoor' in all_paths_df.columns and 'TargetDoor' in all_paths_df.columns:
         w_map = {}
@@ -139,6 +159,13 @@ def prepare_cytoscape_elements(device_attributes_df, path_viz_data_df, all_paths
             
             is_to_inner = bool(r_edge.get('is_to_inner_default', (t_l and s_l and t_l > s_l)))
             if s_l is not None and t_l is not None and s_l > 0 and t_l > 0:
+                edge_classes = []
+                if door_data.get(s, {}).get('is_entrance'):
+                    edge_classes.append('access')
+                if s_l != t_l:
+                    edge_classes.append('security')  # crosses an onion layer boundary
+                if door_data.get(t, {}).get('is_critical'):
+                    edge_classes.append('critical')
                 edges.append({
                     'data': {
                         'source': s,
@@ -149,8 +176,107 @@ def prepare_cytoscape_elements(device_attributes_df, path_viz_data_df, all_paths
                         'source_layer': s_l,
                         'target_layer': t_l, 
                         'is_to_inner_default': is_to_inner
-                    }
+                    },
+                    'classes': ' '.join(edge_classes)
                 })
     
     logger.info(f"DEBUG: Cytoscape Prep: Prepared {len(nodes)} nodes, {len(edges)} edges.")
-    return nodes, edges
\ No newline at end of file
+    if max_nodes is not None:
+        elements = nodes + edges
+        coarse = coarsen_cytoscape_elements(elements, max_nodes)
+        if coarse is not elements:
+            nodes = [el for el in coarse if 'source' not in el['data']]
+            edges = [el for el in coarse if 'source' in el['data']]
+    return nodes, edges
+
+
+def _group_value(data, field):
+    """ A door's floor/layer as a group label, or None when it is missing or 'N/A'. """
+    value = data.get(field)
+    if value is None or pd.isna(value) or str(value).strip().lower() in ('', 'n/a', 'nan', 'none'):
+        return None
+    return str(value)
+
+
+def _group_sort_key(name):
+    """ Numeric floor/layer labels in numeric order ('2' before '10'), then the rest by name. """
+    try:
+        return (0, float(name), name)
+    except (TypeError, ValueError):
+        return (1, 0.0, str(name))
+
+
+def coarsen_cytoscape_elements(elements, max_nodes=MAX_RENDERED_NODES):
+    """ Collapses doors into one compound node per floor once the graph exceeds max_nodes.
+
+    Doors are grouped by floor when they span at least two known floors, otherwise by
+    onion layer; with neither, the elements are returned unchanged. Each group node
+    carries its doors and internal edges in data['members'] / data['edges'], and each
+    aggregated edge between groups carries the edges it replaces, so the client can
+    expand the graph without another round trip.
+    """
+    nodes = [el for el in elements if 'source' not in el.get('data', {})]
+    if len(nodes) <= max_nodes:
+        return elements
+
+    # Layer parents are dropped: doors are regrouped, and the groups replace them
+    doors = [node for node in nodes if not node['data'].get('is_layer_parent')]
+    for field in ('floor', 'layer'):
+        if len({_group_value(node['data'], field) for node in doors} - {None}) > 1:
+            break
+    else:
+        logger.info(f"Not coarsening {len(nodes)} nodes: doors carry no floor or layer to group by.")
+        return elements
+    prefix, title = field, field.capitalize()
+
+    door_group = {}
+    groups = {}
+    for node in doors:
+        data = node['data']
+        group = _group_value(data, field) or 'N/A'
+        member = {k: v for k, v in data.items() if k != 'parent'}
+        groups.setdefault(group, {'members': [], 'edges': []})['members'].append(
+            {'data': member, 'classes': node.get('classes', '')}
+        )
+        door_group[data['id']] = group
+
+    coarse_edges = {}
+    for edge in elements:
+        data = edge.get('data', {})
+        if 'source' not in data:
+            continue
+        s_g, t_g = door_group.get(data['source']), door_group.get(data['target'])
+        if s_g is None or t_g is None:
+            continue
+        if s_g == t_g:
+            groups[s_g]['edges'].append(edge)
+            continue
+        pair = tuple(sorted((s_g, t_g), key=_group_sort_key))
+        coarse = coarse_edges.setdefault(pair, {
+            'id': f"{prefix}-{pair[0]}_to_{prefix}-{pair[1]}",
+            'source': f"{prefix}-{pair[0]}",
+            'target': f"{prefix}-{pair[1]}",
+            'width': 0.0,
+            'actual_frequency': 0,
+            'edges': []
+        })
+        coarse['width'] += float(data.get('width', 1.0))
+        coarse['actual_frequency'] += int(data.get('actual_frequency', 0))
+        coarse['edges'].append(edge)
+
+    coarse_elements = [
+        {
+            'data': {
+                'id': f"{prefix}-{name}",
+                'label': f"{title} {name} ({len(group['members'])} doors)",
+                'door_count': len(group['members']),
+                'members': group['members'],
+                'edges': group['edges']
+            },
+            'classes': 'compound'
+        }
+        for name, group in sorted(groups.items(), key=lambda item: _group_sort_key(item[0]))
+    ]
+    coarse_elements.extend({'data': data, 'classes': 'coarse'} for data in coarse_edges.values())
+    logger.info(f"Coarsened {len(nodes)} nodes into {len(groups)} {field} groups.")
+    return coarse_elements
@@ -109,11 +109,11 @@ def sample_processed_data(sample_access_data):
 def sample_device_attributes():
     """Sample device attributes for testing graph components"""
     return pd.DataFrame([
-        {'DoorID (Device Name)': 'DOOR_001', 'FinalGlobalDeviceDepth': 1, 'IsOfficialEntrance': True, 'IsGloballyCritical': False, 'Floor': '1', 'SecurityLevel': 'green'},
-        {'DoorID (Device Name)': 'DOOR_002', 'FinalGlobalDeviceDepth': 2, 'IsOfficialEntrance': False, 'IsGloballyCritical': False, 'Floor': '1', 'SecurityLevel': 'yellow'},
-        {'DoorID (Device Name)': 'DOOR_003', 'FinalGlobalDeviceDepth': 2, 'IsOfficialEntrance': False, 'IsGloballyCritical': False, 'Floor': '2', 'SecurityLevel': 'green'},
-        {'DoorID (Device Name)': 'DOOR_004', 'FinalGlobalDeviceDepth': 3, 'IsOfficialEntrance': False, 'IsGloballyCritical': True, 'Floor': '2', 'SecurityLevel': 'red'},
-        {'DoorID (Device Name)': 'DOOR_005', 'FinalGlobalDeviceDepth': 1, 'IsOfficialEntrance': True, 'IsGloballyCritical': False, 'Floor': '1', 'SecurityLevel': 'green'}
+        {'DoorID': 'DOOR_001', 'FinalGlobalDeviceDepth': 1, 'IsOfficialEntrance': True, 'IsGloballyCritical': False, 'Floor': '1', 'SecurityLevel': 'green'},
+        {'DoorID': 'DOOR_002', 'FinalGlobalDeviceDepth': 2, 'IsOfficialEntrance': False, 'IsGloballyCritical': False, 'Floor': '1', 'SecurityLevel': 'yellow'},
+        {'DoorID': 'DOOR_003', 'FinalGlobalDeviceDepth': 2, 'IsOfficialEntrance': False, 'IsGloballyCritical': False, 'Floor': '2', 'SecurityLevel': 'green'},
+        {'DoorID': 'DOOR_004', 'FinalGlobalDeviceDepth': 3, 'IsOfficialEntrance': False, 'IsGloballyCritical': True, 'Floor': '2', 'SecurityLevel': 'red'},
+        {'DoorID': 'DOOR_005', 'FinalGlobalDeviceDepth': 1, 'IsOfficialEntrance': True, 'IsGloballyCritical': False, 'Floor': '1', 'SecurityLevel': 'green'}
     ])
 
 
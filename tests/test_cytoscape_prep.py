@@ -1,4 +1,10 @@
-from services.cytoscape_prep import prepare_path_visualization_data
+import pandas as pd
+
+from services.cytoscape_prep import (
+    prepare_path_visualization_data,
+    prepare_cytoscape_elements,
+    coarsen_cytoscape_elements,
+)
 from tests.fixtures.sample_data import load_sample_access_logs
 
 
@@ -10,3 +16,77 @@ def test_prepare_path_visualization_data_from_file():
     viz = prepare_path_visualization_data(paths[['SourceDoor', 'TargetDoor', 'TransitionFrequency']])
     assert not viz.empty
     assert set(viz.columns) == {'Door1', 'Door2', 'PathWidth'}
+
+
+def test_coarsen_cytoscape_elements_groups_doors_by_floor():
+    nodes = [{'data': {'id': f'D{i}', 'floor': str(i % 2 + 1)}, 'classes': 'door'} for i in range(6)]
+    edges = [{'data': {'source': f'D{i}', 'target': f'D{i + 1}', 'width': 1.0}} for i in range(5)]
+    elements = nodes + edges
+    # Small graphs pass through untouched
+    assert coarsen_cytoscape_elements(elements, max_nodes=10) is elements
+
+    coarse = coarsen_cytoscape_elements(elements, max_nodes=4)
+    groups = [el for el in coarse if el.get('classes') == 'compound']
+    assert [g['data']['id'] for g in groups] == ['floor-1', 'floor-2']
+    assert sum(g['data']['door_count'] for g in groups) == 6
+    (link,) = [el for el in coarse if el.get('classes') == 'coarse']
+    assert link['data']['width'] == 5.0
+    assert len(link['data']['edges']) == 5
+
+
+def test_coarsen_cytoscape_elements_falls_back_to_layers_without_floors():
+    nodes = [{'data': {'id': f'D{i}', 'floor': 'N/A', 'layer': i % 3 + 1}} for i in range(6)]
+    coarse = coarsen_cytoscape_elements(nodes, max_nodes=4)
+    assert [g['data']['id'] for g in coarse] == ['layer-1', 'layer-2', 'layer-3']
+
+    # Nothing to group by: leave the graph alone rather than merge every door into one node
+    bare = [{'data': {'id': f'D{i}'}} for i in range(6)]
+    assert coarsen_cytoscape_elements(bare, max_nodes=4) is bare
+
+
+def test_coarsen_cytoscape_elements_orders_numeric_floors_numerically():
+    nodes = [{'data': {'id': f'D{i}', 'floor': floor}} for i, floor in enumerate(['10', '2', '1', '10', 'B'])]
+    edges = [{'data': {'source': 'D0', 'target': 'D1'}}, {'data': {'source': 'D2', 'target': 'D0'}}]
+    coarse = coarsen_cytoscape_elements(nodes + edges, max_nodes=3)
+    assert [el['data']['id'] for el in coarse if el['classes'] == 'compound'] == [
+        'floor-1', 'floor-2', 'floor-10', 'floor-B'
+    ]
+    assert [el['data']['id'] for el in coarse if el['classes'] == 'coarse'] == [
+        'floor-2_to_floor-10', 'floor-1_to_floor-10'
+    ]
+
+
+def test_prepare_cytoscape_elements_coarsens_large_graphs():
+    doors = [f'D{i}' for i in range(12)]
+    device_attrs = pd.DataFrame({
+        'DoorID': doors,
+        'FinalGlobalDeviceDepth': [1 + i % 2 for i in range(12)],
+        'Floor': [str(1 + i // 6) for i in range(12)],
+    })
+    paths = pd.DataFrame({'SourceDoor': doors[:-1], 'TargetDoor': doors[1:], 'TransitionFrequency': 1})
+
+    nodes, edges = prepare_cytoscape_elements(device_attrs.copy(), None, paths, max_nodes=None)
+    assert len(nodes) == 14 and len(edges) == 11  # 2 layer parents + 12 doors
+
+    nodes, edges = prepare_cytoscape_elements(device_attrs.copy(), None, paths, max_nodes=10)
+    assert [n['data']['id'] for n in nodes] == ['floor-1', 'floor-2']
+    assert [e['data']['id'] for e in edges] == ['floor-1_to_floor-2']
+    assert edges[0]['data']['actual_frequency'] == 1
+
+
+def test_prepare_cytoscape_elements_sets_style_classes():
+    device_attrs = pd.DataFrame({
+        'DoorID': ['ENT', 'MID', 'VAULT'],
+        'FinalGlobalDeviceDepth': [1, 2, 3],
+        'IsOfficialEntrance': [True, False, False],
+        'IsGloballyCritical': [False, False, True],
+    })
+    paths = pd.DataFrame({'SourceDoor': ['ENT', 'MID', 'MID'], 'TargetDoor': ['MID', 'VAULT', 'MID'],
+                          'TransitionFrequency': [3, 2, 1]})
+    nodes, edges = prepare_cytoscape_elements(device_attrs, None, paths)
+
+    door_classes = {n['data']['id']: n['classes'] for n in nodes if not n['data'].get('is_layer_parent')}
+    assert door_classes == {'ENT': 'door entrance', 'MID': 'door', 'VAULT': 'door core critical'}
+    edge_classes = {(e['data']['source'], e['data']['target']): e['classes'] for e in edges}
+    assert edge_classes == {('ENT', 'MID'): 'access security', ('MID', 'VAULT'): 'security critical',
+                            ('MID', 'MID'): ''}
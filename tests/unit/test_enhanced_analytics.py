@@ -0,0 +1,207 @@
+import pytest
+import numpy as np
+import pandas as pd
+from datetime import timedelta
+
+from config.settings import REQUIRED_INTERNAL_COLUMNS
+from utils.enhanced_analytics import (
+    EnhancedAnomalyDetector,
+    EnhancedDataProcessor,
+    generate_trend_indicator,
+)
+
+
+@pytest.mark.parametrize("values", [[], [5.0]])
+def test_trend_indicator_needs_two_values(values):
+    assert generate_trend_indicator(values) == "📊"
+
+
+@pytest.mark.parametrize("values, expected", [
+    # Two or three values: the recent average is compared against the first value
+    ([10, 10], "📊"),
+    ([10, 20], "📈"),
+    ([10, 12, 2], "📉"),
+    ([10, 10, 10], "📊"),
+])
+def test_trend_indicator_short_series(values, expected):
+    assert generate_trend_indicator(values) == expected
+
+
+@pytest.mark.parametrize("values, expected", [
+    # Four or more: the last three values against everything before them
+    ([1, 1, 1, 1], "📊"),
+    ([1, 1, 1, 5, 5, 5], "📈"),
+    ([5, 5, 5, 1, 1, 1], "📉"),
+    ([10, 10, 10.5, 10.5, 10.5], "📊"),
+])
+def test_trend_indicator_long_series(values, expected):
+    assert generate_trend_indicator(values) == expected
+
+
+# Parity with the original per-user / per-row implementations on small fixtures
+
+TS = REQUIRED_INTERNAL_COLUMNS['Timestamp']
+USER = REQUIRED_INTERNAL_COLUMNS['UserID']
+DOOR = REQUIRED_INTERNAL_COLUMNS['DoorID']
+EVENT = REQUIRED_INTERNAL_COLUMNS['EventType']
+
+
+def _events(rows):
+    """Event frame from (timestamp, user, door) tuples"""
+    timestamps, users, doors = zip(*rows) if rows else ((), (), ())
+    return pd.DataFrame({
+        TS: pd.to_datetime(list(timestamps)).astype('datetime64[ns]'),
+        USER: pd.Series(users, dtype=object),
+        DOOR: pd.Series(doors, dtype=object),
+        EVENT: pd.Series(['ACCESS GRANTED'] * len(users), dtype=object),
+    })
+
+
+MULTI_DAY = _events([
+    ('2025-01-06 08:00', 'U1', 'D1'), ('2025-01-06 08:10', 'U1', 'D2'),
+    ('2025-01-06 09:30', 'U1', 'D3'), ('2025-01-06 23:15', 'U2', 'D1'),
+    ('2025-01-07 00:20', 'U2', 'D2'), ('2025-01-07 08:05', 'U3', 'D1'),
+    ('2025-01-07 08:20', 'U3', 'D2'), ('2025-01-11 02:00', 'U1', 'D1'),
+    ('2025-01-11 02:05', 'U1', 'D3'), ('2025-01-12 22:40', 'U2', 'D3'),
+    ('2025-01-12 22:50', 'U2', 'D1'), ('2025-01-13 08:00', 'U3', 'D2'),
+])
+SINGLE_EVENT = _events([('2025-01-06 08:00', 'U1', 'D1')])
+WITH_NAT = _events([
+    ('2025-01-06 08:00', 'U1', 'D1'), (None, 'U1', 'D2'),
+    ('2025-01-06 08:45', 'U1', 'D3'), ('2025-01-06 09:00', 'U2', 'D1'),
+    (None, 'U2', 'D3'), ('2025-01-11 23:30', 'U2', 'D2'),
+])
+MISSING_DOOR = _events([
+    ('2025-01-06 08:00', 'U1', 'D1'), ('2025-01-06 08:05', 'U1', None),
+    ('2025-01-06 08:10', 'U1', 'D2'), ('2025-01-06 09:00', 'U2', None),
+    ('2025-01-06 09:10', 'U2', 'D1'), ('2025-01-07 10:00', 'U2', 'D1'),
+])
+EMPTY = _events([])
+
+FIXTURES = pytest.mark.parametrize(
+    "df", [MULTI_DAY, SINGLE_EVENT, WITH_NAT, MISSING_DOOR, EMPTY],
+    ids=["multi_day", "single", "nat", "missing_door", "empty"]
+)
+
+
+def _reference_slope(series):
+    if len(series) < 2:
+        return 0.0
+    x = np.arange(len(series))
+    y = series.values
+    n = len(x)
+    return (n * np.sum(x * y) - np.sum(x) * np.sum(y)) / (n * np.sum(x**2) - (np.sum(x))**2)
+
+
+def _reference_sessions(df):
+    sessions = []
+    for user_id in df[USER].unique():
+        user_data = df[df[USER] == user_id].sort_values(TS)
+        session_groups = (user_data[TS].diff() > timedelta(minutes=30)).cumsum()
+        for _, session_data in user_data.groupby(session_groups):
+            sessions.append((session_data[TS].max() - session_data[TS].min()).total_seconds() / 60)
+    if not sessions:
+        return {'avg_length': 0, 'total_count': 0, 'avg_per_user': 0}
+    return {
+        'avg_length': pd.Series(sessions).mean(),
+        'total_count': len(sessions),
+        'avg_per_user': len(sessions) / df[USER].nunique(),
+    }
+
+
+def _reference_access_patterns(df):
+    sequences = []
+    for user_id in df[USER].unique():
+        door_sequence = df[df[USER] == user_id].sort_values(TS)[DOOR].tolist()
+        sequences.extend(zip(door_sequence[:-1], door_sequence[1:]))
+    if not sequences:
+        return {'sequences': {}, 'unique_patterns': 0}
+    sequence_counts = pd.Series(sequences).value_counts()
+    return {'sequences': sequence_counts.head(10).to_dict(), 'unique_patterns': len(sequence_counts)}
+
+
+def _reference_time_anomalies(df):
+    anomalies = []
+    total_events = len(df)
+    if total_events == 0:
+        return anomalies
+    night_ratio = df[TS].dt.hour.isin([22, 23, 0, 1, 2, 3, 4, 5]).sum() / total_events
+    if night_ratio > 0.2:
+        anomalies.append(('unusual_night_activity', night_ratio))
+    weekend_ratio = df[TS].dt.dayofweek.isin([5, 6]).sum() / total_events
+    if weekend_ratio > 0.3:
+        anomalies.append(('high_weekend_activity', weekend_ratio))
+    return anomalies
+
+
+@FIXTURES
+def test_temporal_distributions_match_groupby(df):
+    patterns = EnhancedDataProcessor().process_temporal_patterns(df)
+    if df.empty:
+        assert patterns['hourly_distribution'] == {}
+        return
+    assert patterns['hourly_distribution'] == df.groupby(df[TS].dt.hour).size().to_dict()
+    assert patterns['daily_distribution'] == df.groupby(df[TS].dt.day_name()).size().to_dict()
+    daily = df.groupby(df[TS].dt.date).size()
+    assert patterns['daily_average'] == pytest.approx(daily.mean())
+    assert patterns['trend_slope'] == pytest.approx(_reference_slope(daily))
+
+
+@pytest.mark.parametrize("values", [[5], [3, 3], [1, 4, 2, 8], [10, 0, 7, 7, 1, 3, 12]])
+def test_trend_slope_matches_least_squares(values):
+    series = pd.Series(values)
+    assert EnhancedDataProcessor()._calculate_trend_slope(series) == pytest.approx(_reference_slope(series))
+
+
+@FIXTURES
+def test_user_sessions_match_per_user_loop(df):
+    sessions = EnhancedDataProcessor()._analyze_user_sessions(df)
+    expected = _reference_sessions(df)
+    assert sessions['total_count'] == expected['total_count']
+    assert sessions['avg_length'] == pytest.approx(expected['avg_length'])
+    assert sessions['avg_per_user'] == pytest.approx(expected['avg_per_user'])
+
+
+@FIXTURES
+def test_access_patterns_match_per_user_loop(df):
+    assert EnhancedDataProcessor()._analyze_access_patterns(df) == _reference_access_patterns(df)
+
+
+@FIXTURES
+def test_time_anomalies_match_datetime_fields(df):
+    anomalies = EnhancedAnomalyDetector()._detect_time_anomalies(df, detected_at='fixed')
+    assert [(a['type'], pytest.approx(a['value'])) for a in anomalies] == _reference_time_anomalies(df)
+    assert all(a['timestamp'] == 'fixed' for a in anomalies)
+
+
+def test_access_patterns_report_missing_doors_as_none():
+    sequences = EnhancedDataProcessor()._analyze_access_patterns(MISSING_DOOR)['sequences']
+    assert sequences[('D1', None)] == 1
+    assert sequences[(None, 'D1')] == 1
+
+
+TIED = _events([
+    ('2025-01-06 08:00', 'U3', 'D3'), ('2025-01-06 08:05', 'U2', 'D2'),
+    ('2025-01-06 08:10', 'U2', 'D2'), ('2025-01-06 08:15', 'U3', 'D3'),
+    ('2025-01-06 08:20', 'U1', 'D1'),
+])
+
+
+@pytest.mark.parametrize("categories", [['1', '2', '3'], ['3', '1', '2'], ['2', '3', '1']])
+def test_most_active_ties_follow_value_counts_for_categorical_input(categories):
+    df = TIED.assign(**{
+        DOOR: pd.Categorical(TIED[DOOR], categories=[f'D{c}' for c in categories]),
+        USER: pd.Categorical(TIED[USER], categories=[f'U{c}' for c in categories]),
+    })
+    processor = EnhancedDataProcessor()
+    
+    devices = processor.process_device_analytics(df)
+    assert devices['most_active_device'] == df[DOOR].value_counts().index[0]
+    assert devices['most_active_device_count'] == 2
+    users = processor.process_user_behavior(df)
+    assert users['most_active_user'] == df[USER].value_counts().index[0]
+
+
+def test_most_active_ties_follow_value_counts_for_object_input():
+    users = EnhancedDataProcessor().process_user_behavior(TIED)
+    assert users['most_active_user'] == TIED[USER].value_counts().index[0] == 'U3'
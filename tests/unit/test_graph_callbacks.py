@@ -0,0 +1,35 @@
+
+
+def _output_ids(callback_key):
+    """'..a.b...c.d@hash..' or 'a.b' -> {'a.b', 'c.d'}"""
+    outputs = callback_key.strip('.').split('...') if callback_key.startswith('..') else [callback_key]
+    return {output.split('@')[0] for output in outputs}
+
+
+def _writers(app, prop):
+    return [key for key in app.callback_map if prop in _output_ids(key)]
+
+
+def _assert_spinner_is_cleared(app):
+    spinner = app.callback_map['graph-spinner.style']
+    assert [(i['id'], i['property']) for i in spinner['inputs']] == [('graph-loading', 'data')]
+    
+    # Anything that can raise the flag needs a graph data callback that lowers it again
+    setters = _writers(app, 'graph-loading.data')
+    if setters:
+        clearers = [key for key in setters if 'onion-graph.elements' in _output_ids(key)]
+        assert clearers, f"graph-loading is set by {setters} but never cleared"
+
+
+def test_production_spinner_has_a_writer_that_clears_it():
+    from app_production import create_production_app
+    app = create_production_app()
+    _assert_spinner_is_cleared(app)
+    # Production has no generate callback writing the graph, so nothing raises the flag
+    assert _writers(app, 'graph-loading.data') == []
+
+
+def test_dev_app_generate_callback_clears_spinner():
+    import app as dev_app
+    _assert_spinner_is_cleared(dev_app.app)
+    assert len(_writers(dev_app.app, 'graph-loading.data')) == 2
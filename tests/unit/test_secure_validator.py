@@ -0,0 +1,74 @@
+import io
+import re
+
+import pandas as pd
+import pytest
+
+from utils.secure_validator import MALICIOUS_PATTERNS, SecureFileValidator, _control_byte_count
+
+
+def _reference_threats(file_content):
+    """Original scan: every pattern searched separately on the decoded text"""
+    content_str = file_content.decode('utf-8', errors='ignore')
+    return [
+        f"Suspicious pattern detected: {pattern}"
+        for pattern in MALICIOUS_PATTERNS
+        if re.search(pattern, content_str, re.IGNORECASE)
+    ]
+
+
+@pytest.mark.parametrize("content", [
+    b"a,b\n1,2\n3,4\n",
+    b"a,b\n1,2\n3,4",
+    b"a,b\r\n1,2\r\n3,4\r\n",
+    b"a,b\n1,2\n",
+    b"a,b\n1,2",
+])
+def test_csv_row_count_is_exact(content):
+    result = SecureFileValidator()._validate_csv_structure(content)
+    assert result['valid']
+    assert result['row_count'] == len(pd.read_csv(io.BytesIO(content)))
+    assert result['column_count'] == 2
+
+
+def test_csv_row_limit_checked_before_parsing():
+    validator = SecureFileValidator()
+    validator.max_rows = 2
+    result = validator._validate_csv_structure(b"a,b\n1,2\n3,4\n5,6\n")
+    assert not result['valid']
+    assert 'Too many rows' in result['errors'][0]
+
+
+def test_csv_header_only_is_empty():
+    result = SecureFileValidator()._validate_csv_structure(b"a,b\n")
+    assert result == {'valid': False, 'errors': ['CSV file is empty']}
+
+
+@pytest.mark.parametrize("content", [
+    b"name,door\nalice,D1\n",
+    b"name,note\nbob,<SCRIPT src=x>\n",
+    b"name,note\nbob,JavaScript:alert(1)\n",
+    b"name,note\nbob,import   os\n",
+    b"name,note\nbob,<% x %>\n",
+    b"",
+])
+def test_malicious_scan_matches_per_pattern_search(content):
+    result = SecureFileValidator()._check_malicious_patterns(content)
+    expected = _reference_threats(content)
+    assert result['safe'] == (not expected)
+    assert result['threats'] == expected[:1]
+
+
+def test_malicious_scan_reports_first_match_only():
+    content = b"note\nsubprocess\neval(x)\n<?php echo 1; ?>\n"
+    result = SecureFileValidator()._check_malicious_patterns(content)
+    assert not result['safe']
+    # Several patterns hit; the scan stops at the earliest one in the file
+    assert len(_reference_threats(content)) == 3
+    assert result['threats'] == ["Suspicious pattern detected: subprocess"]
+
+
+@pytest.mark.parametrize("content", [b"", b"a,b\n1,2\r\n", b"a\tb\x00\x01\x1f\x20\x7f", bytes(range(256))])
+def test_control_byte_count_matches_per_char_count(content):
+    expected = sum(1 for c in content.decode('utf-8', errors='ignore') if ord(c) < 32 and c not in '\r\n\t')
+    assert _control_byte_count(content) == expected
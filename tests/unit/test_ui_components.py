@@ -1,8 +1,12 @@
+import gc
+import weakref
+
 import pytest
-from dash import dcc, html
+from dash import Dash, dcc, html
 
 from ui.components.upload import create_simple_upload_component, EnhancedUploadComponent
 from ui.components.common import LoadingComponent
+from ui.pages.main_page import create_main_layout
 
 
 def test_create_simple_upload_component():
@@ -25,3 +29,23 @@ def test_loading_spinner_returns_div():
 def test_progress_bar_returns_div():
     bar = LoadingComponent.create_progress_bar(50)
     assert isinstance(bar, html.Div)
+
+
+def test_main_layout_is_fresh_per_call():
+    app = Dash(__name__)
+    first = create_main_layout(app)
+    # app.py patches the returned layout in place; the next build must not see that
+    first.children[0].children = []
+    second = create_main_layout(app)
+    assert second is not first
+    assert second.children[0].children != []
+
+
+def test_main_layout_does_not_keep_apps_alive():
+    app = Dash(__name__)
+    app_ref = weakref.ref(app)
+    create_main_layout(app)
+    Dash(__name__)  # Dash remembers the most recently created app
+    del app
+    gc.collect()
+    assert app_ref() is None
@@ -2,17 +2,19 @@
 
 """UI components package."""
 
-# Clean imports - only import what actually exists
-from .upload import (
-    EnhancedUploadComponent,
-    create_enhanced_upload_component,
-    create_upload_component,
-    create_simple_upload_component
-)
+from importlib import import_module
 
 __all__ = [
     'EnhancedUploadComponent',
     'create_enhanced_upload_component', 
     'create_upload_component',
     'create_simple_upload_component',
-]
\ No newline at end of file
+]
+
+
+# Re-exports resolve on first attribute access so that importing a
+# subpackage (e.g. ui.pages) does not drag in the upload component
+def __getattr__(name):
+    if name in __all__:
+        return getattr(import_module('.upload', __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -14,6 +14,123 @@ from ui.themes.style_config import (
     CLASSIFICATION_STYLES,
 )
 
+# Built once at import instead of on every re-mount of the setup card.
+# Kept as plain dicts: Dash cannot serialize MappingProxyType props.
+# Mark keys are pre-stringified since JSON object keys must be strings anyway.
+_FLOOR_SLIDER_MARKS = {**{str(i): str(i) for i in range(1, 20, 2)}, '48': '48'}
+
+# Shared by every per-door security slider in the classification list
+_SECURITY_SLIDER_MARKS = {
+    str(i): {
+        'label': str(i),
+        'style': {
+            'color': COLORS['text_secondary'],
+            'fontSize': TYPOGRAPHY['text_xs']
+        }
+    } for i in (0, 2, 4, 6, 8, 10)
+}
+
+_FLOOR_LABEL_STYLE = {
+    'color': COLORS['text_primary'],
+    'fontWeight': TYPOGRAPHY['font_bold'],
+    'fontSize': '1rem',
+    'marginBottom': '8px',
+    'textAlign': 'center',
+    'display': 'block'
+}
+
+_FLOOR_DISPLAY_STYLE = {
+    "fontSize": "0.9rem",
+    "color": COLORS['text_secondary'],
+    "marginTop": "6px",
+    "textAlign": "center",
+    "fontWeight": "600"
+}
+
+_FLOOR_HELP_STYLE = {
+    'color': COLORS['text_tertiary'],
+    'fontSize': '0.8rem',
+    'textAlign': 'center',
+    'display': 'block',
+    'marginTop': '4px',
+    'marginBottom': '24px'
+}
+
+_RADIO_LABEL_STYLE = {
+    'color': COLORS['text_primary'],
+    'fontSize': '1rem',
+    'marginBottom': '12px',
+    'textAlign': 'center',
+    'display': 'block',
+    'fontWeight': TYPOGRAPHY['font_bold']
+}
+
+_RADIO_HELP_STYLE = {
+    'color': COLORS['text_tertiary'],
+    'fontSize': '0.8rem',
+    'textAlign': 'center',
+    'display': 'block',
+    'marginTop': '8px'
+}
+
+# Per-door row styles. The door list renders one row per door, so resolving
+# the theme tokens here keeps COLORS/TYPOGRAPHY lookups out of that loop.
+_DOOR_ID_STYLE = {
+    'fontWeight': TYPOGRAPHY['font_semibold'],
+    'color': COLORS['text_primary'],
+    'fontSize': TYPOGRAPHY['text_base'],
+    'flex': '0 0 200px',
+    'display': 'flex',
+    'alignItems': 'center'
+}
+
+_FLOOR_DROPDOWN_STYLE = {
+    'backgroundColor': COLORS['surface'],
+    'borderColor': COLORS['border'],
+    'color': COLORS['text_primary'],
+    'width': '80px'
+}
+
+_FLOOR_CELL_STYLE = {'flex': '0 0 80px', 'marginRight': SPACING['sm']}
+_TOGGLE_CELL_STYLE = {'flex': '0 0 100px', 'marginRight': SPACING['sm']}
+_SLIDER_CELL_STYLE = {'flex': '1', 'minWidth': '150px', 'paddingTop': '10px'}
+
+_PILL_BASE_STYLE = {
+    'borderRadius': BORDER_RADIUS['full'],
+    'padding': f"{SPACING['xs']} {SPACING['sm']}",
+    'border': f"1px solid {COLORS['border']}",
+    'cursor': 'pointer',
+    'fontSize': TYPOGRAPHY['text_sm'],
+    'transition': 'all 0.2s ease',
+    'display': 'inline-block',
+    'textAlign': 'center'
+}
+
+_PILL_ACTIVE_STYLE = {
+    'backgroundColor': COLORS['success'],
+    'color': 'white',
+    **_PILL_BASE_STYLE
+}
+
+_PILL_INACTIVE_STYLE = {
+    'backgroundColor': COLORS['surface'],
+    'color': COLORS['text_secondary'],
+    **_PILL_BASE_STYLE
+}
+
+_DOOR_ROW_STYLE = {
+    'display': 'flex',
+    'alignItems': 'center',
+    'padding': SPACING['base'],
+    'backgroundColor': COLORS['surface'],
+    'borderRadius': BORDER_RADIUS['md'],
+    'border': f"1px solid {COLORS['border']}",
+    'marginBottom': SPACING['sm'],
+    'boxShadow': SHADOWS['sm'],
+    'transition': 'all 0.2s ease',
+    'gap': SPACING['sm']
+}
+
 
 class ClassificationComponent:
     """Centralized classification component with simplified toggle - COMPLETE"""
@@ -60,9 +177,9 @@ class ClassificationComponent:
                     style={'textAlign': 'center', 'marginBottom': '16px'},
                 ),
                 # Floors Slider Row
-                self.create_floors_slider_row(),
+                *self.create_floors_slider_row(),
                 # Simplified Toggle Row (no Bootstrap switch)
-                self.create_simplified_toggle_row(),
+                *self.create_simplified_toggle_row(),
                 dbc.Button(
                     'Confirm Selections & Generate Enhanced Analysis',
                     id='confirm-and-generate-button',
@@ -74,18 +191,11 @@ class ClassificationComponent:
         )
     
     def create_floors_slider_row(self):
-        """Creates the modern floors slider"""
-        return html.Div([
+        """Creates the modern floors slider (children spliced straight into the card)"""
+        return [
             html.Label(
                 "How many floors are in the facility?", 
-                style={
-                    'color': COLORS['text_primary'],
-                    'fontWeight': TYPOGRAPHY['font_bold'],
-                    'fontSize': '1rem',
-                    'marginBottom': '8px',
-                    'textAlign': 'center',
-                    'display': 'block'
-                }
+                style=_FLOOR_LABEL_STYLE
             ),
             
             # Modern Slider (1-48 floors)
@@ -95,7 +205,7 @@ class ClassificationComponent:
                 max=48,
                 step=1,
                 value=48,
-                marks={**{i: str(i) for i in range(1, 20, 2)}, 48: '48'},
+                marks=_FLOOR_SLIDER_MARKS,
                 tooltip={"always_visible": False, "placement": "bottom"},
                 updatemode="drag",
                 className="modern-floor-slider"
@@ -105,42 +215,22 @@ class ClassificationComponent:
             html.Div(
                 id="floor-slider-value",
                 children="48 floors",
-                style={
-                    "fontSize": "0.9rem",
-                    "color": COLORS['text_secondary'],
-                    "marginTop": "6px",
-                    "textAlign": "center",
-                    "fontWeight": "600"
-                }
+                style=_FLOOR_DISPLAY_STYLE
             ),
             
             # Helper text
             html.Small(
                 "Count floors above ground including mezzanines and secure zones.", 
-                style={
-                    'color': COLORS['text_tertiary'],
-                    'fontSize': '0.8rem',
-                    'textAlign': 'center',
-                    'display': 'block',
-                    'marginTop': '4px',
-                    'marginBottom': '24px'
-                }
+                style=_FLOOR_HELP_STYLE
             )
-        ])
+        ]
     
     def create_simplified_toggle_row(self):
-        """Creates a simplified toggle using styled radio items - CLEAN VERSION"""
-        return html.Div([
+        """Creates a simplified toggle using styled radio items (children spliced into the card)"""
+        return [
             html.Label(
                 "Enable Manual Door Classification?", 
-                style={
-                    'color': COLORS['text_primary'],
-                    'fontSize': '1rem',
-                    'marginBottom': '12px',
-                    'textAlign': 'center',
-                    'display': 'block',
-                    'fontWeight': TYPOGRAPHY['font_bold']
-                }
+                style=_RADIO_LABEL_STYLE
             ),
             
             # Clean RadioItems - NO CONFLICTING STYLES
@@ -158,15 +248,9 @@ class ClassificationComponent:
             
             html.Small(
                 "Choose 'Yes' to manually set security levels for each door, or 'No' for automatic classification.", 
-                style={
-                    'color': COLORS['text_tertiary'],
-                    'fontSize': '0.8rem',
-                    'textAlign': 'center',
-                    'display': 'block',
-                    'marginTop': '8px'
-                }
+                style=_RADIO_HELP_STYLE
             )
-        ])
+        ]
     
     def create_door_classification_card(self):
         """Creates Step 3: Door Classification card - MISSING METHOD FIXED"""
@@ -271,17 +355,7 @@ class ClassificationComponent:
         
         return html.Div([
             # Door ID Label
-            html.Div(
-                door_id, 
-                style={
-                    'fontWeight': TYPOGRAPHY['font_semibold'], 
-                    'color': COLORS['text_primary'],
-                    'fontSize': TYPOGRAPHY['text_base'],
-                    'flex': '0 0 200px',
-                    'display': 'flex',
-                    'alignItems': 'center'
-                }
-            ),
+            html.Div(door_id, style=_DOOR_ID_STYLE),
             
             # Floor Dropdown
             html.Div([
@@ -290,14 +364,9 @@ class ClassificationComponent:
                     options=floor_options,
                     value=pre_sel_floor,
                     clearable=False,
-                    style={
-                        'backgroundColor': COLORS['surface'],
-                        'borderColor': COLORS['border'],
-                        'color': COLORS['text_primary'],
-                        'width': '80px'
-                    }
+                    style=_FLOOR_DROPDOWN_STYLE
                 )
-            ], style={'flex': '0 0 80px', 'marginRight': SPACING['sm']}),
+            ], style=_FLOOR_CELL_STYLE),
             
             # Entry/Exit Toggle
             html.Div([
@@ -306,20 +375,9 @@ class ClassificationComponent:
                     options=[{'label': 'Entry/Exit', 'value': 'entry_exit'}],
                     value='entry_exit' if pre_sel_door_type == 'entry_exit' else None,
                     className='door-type-pill',
-                    labelStyle={
-                        'backgroundColor': COLORS['success'] if pre_sel_door_type == 'entry_exit' else COLORS['surface'],
-                        'color': 'white' if pre_sel_door_type == 'entry_exit' else COLORS['text_secondary'],
-                        'borderRadius': BORDER_RADIUS['full'],
-                        'padding': f"{SPACING['xs']} {SPACING['sm']}",
-                        'border': f"1px solid {COLORS['border']}",
-                        'cursor': 'pointer',
-                        'fontSize': TYPOGRAPHY['text_sm'],
-                        'transition': 'all 0.2s ease',
-                        'display': 'inline-block',
-                        'textAlign': 'center'
-                    }
+                    labelStyle=_PILL_ACTIVE_STYLE if pre_sel_door_type == 'entry_exit' else _PILL_INACTIVE_STYLE
                 )
-            ], style={'flex': '0 0 100px', 'marginRight': SPACING['sm']}),
+            ], style=_TOGGLE_CELL_STYLE),
             
             # Stairway Toggle
             html.Div([
@@ -328,20 +386,9 @@ class ClassificationComponent:
                     options=[{'label': 'Stairway', 'value': 'stairway'}],
                     value='stairway' if pre_sel_door_type == 'stairway' else None,
                     className='door-type-pill',
-                    labelStyle={
-                        'backgroundColor': COLORS['success'] if pre_sel_door_type == 'stairway' else COLORS['surface'],
-                        'color': 'white' if pre_sel_door_type == 'stairway' else COLORS['text_secondary'],
-                        'borderRadius': BORDER_RADIUS['full'],
-                        'padding': f"{SPACING['xs']} {SPACING['sm']}",
-                        'border': f"1px solid {COLORS['border']}",
-                        'cursor': 'pointer',
-                        'fontSize': TYPOGRAPHY['text_sm'],
-                        'transition': 'all 0.2s ease',
-                        'display': 'inline-block',
-                        'textAlign': 'center'
-                    }
+                    labelStyle=_PILL_ACTIVE_STYLE if pre_sel_door_type == 'stairway' else _PILL_INACTIVE_STYLE
                 )
-            ], style={'flex': '0 0 100px', 'marginRight': SPACING['sm']}),
+            ], style=_TOGGLE_CELL_STYLE),
             
             # Security Level Slider
             html.Div([
@@ -351,30 +398,13 @@ class ClassificationComponent:
                     max=10,
                     step=1,
                     value=pre_sel_security_val,
-                    marks={i: {
-                        'label': str(i),
-                        'style': {
-                            'color': COLORS['text_secondary'],
-                            'fontSize': TYPOGRAPHY['text_xs']
-                        }
-                    } for i in [0, 2, 4, 6, 8, 10]},
+                    marks=_SECURITY_SLIDER_MARKS,
                     tooltip={"placement": "bottom", "always_visible": False},
                     className="security-range-slider"
                 )
-            ], style={'flex': '1', 'minWidth': '150px', 'paddingTop': '10px'})
+            ], style=_SLIDER_CELL_STYLE)
             
-        ], style={
-            'display': 'flex',
-            'alignItems': 'center',
-            'padding': SPACING['base'],
-            'backgroundColor': COLORS['surface'],
-            'borderRadius': BORDER_RADIUS['md'],
-            'border': f"1px solid {COLORS['border']}",
-            'marginBottom': SPACING['sm'],
-            'boxShadow': SHADOWS['sm'],
-            'transition': 'all 0.2s ease',
-            'gap': SPACING['sm']
-        }, className='door-classification-card')
+        ], style=_DOOR_ROW_STYLE, className='door-classification-card')
     
     def get_security_levels_map(self):
         """Returns the security levels mapping"""
@@ -14,6 +14,7 @@ import numpy as np
 from datetime import datetime, timedelta
 import json
 from ui.themes.style_config import COLORS, SPACING, BORDER_RADIUS, SHADOWS, TYPOGRAPHY
+from ui.themes.helpers import merged
 from config.settings.py import REQUIRED_INTERNAL_COLUMNS, SECURITY_LEVELS
 
 
@@ -189,8 +190,7 @@ class EnhancedStatsComponent:
     
     def create_enhanced_access_events_panel(self):
         """Enhanced access events panel with trend indicators"""
-        panel_style = self.panel_style_base.copy()
-        panel_style["borderLeft"] = f'5px solid {COLORS["accent"]}'
+        panel_style = merged(self.panel_style_base, {"borderLeft": f'5px solid {COLORS["accent"]}'})
 
         return html.Div(
             [
@@ -241,8 +241,7 @@ class EnhancedStatsComponent:
     
     def create_enhanced_statistics_panel(self):
         """Enhanced general statistics panel with more metrics"""
-        panel_style = self.panel_style_base.copy()
-        panel_style["borderLeft"] = f'5px solid {COLORS["warning"]}'
+        panel_style = merged(self.panel_style_base, {"borderLeft": f'5px solid {COLORS["warning"]}'})
 
         return html.Div(
             [
@@ -323,8 +322,7 @@ class EnhancedStatsComponent:
     
     def create_enhanced_active_devices_panel(self):
         """Enhanced active devices panel with interactive table"""
-        panel_style = self.panel_style_base.copy()
-        panel_style["borderLeft"] = f'5px solid {COLORS["critical"]}'
+        panel_style = merged(self.panel_style_base, {"borderLeft": f'5px solid {COLORS["critical"]}'})
 
         return html.Div(
             [
@@ -333,65 +331,57 @@ class EnhancedStatsComponent:
                     style={"color": COLORS["text_primary"], "marginBottom": "15px"},
                 ),
                 # Device summary metrics
-                html.Div(
-                    [
-                        html.P(
-                            id="total-devices-summary",
-                            style={
-                                "color": COLORS["text_primary"],
-                                "fontSize": "1.2rem",
-                                "fontWeight": "bold",
-                                "marginBottom": "10px",
-                            },
-                        ),
-                        html.P(
-                            id="active-devices-today",
-                            style={
-                                "color": COLORS["text_secondary"],
-                                "marginBottom": "15px",
-                            },
-                        ),
-                    ]
+                html.P(
+                    id="total-devices-summary",
+                    style={
+                        "color": COLORS["text_primary"],
+                        "fontSize": "1.2rem",
+                        "fontWeight": "bold",
+                        "marginBottom": "10px",
+                    },
+                ),
+                html.P(
+                    id="active-devices-today",
+                    style={
+                        "color": COLORS["text_secondary"],
+                        "marginBottom": "15px",
+                    },
                 ),
                 # Enhanced devices table with sparklines
-                html.Div(
+                html.Table(
                     [
-                        html.Table(
-                            [
-                                html.Thead(
-                                    html.Tr(
-                                        [
-                                            html.Th(
-                                                "DEVICE",
-                                                style={
-                                                    "color": COLORS["text_primary"],
-                                                    "fontSize": "0.8rem",
-                                                },
-                                            ),
-                                            html.Th(
-                                                "EVENTS",
-                                                style={
-                                                    "color": COLORS["text_primary"],
-                                                    "fontSize": "0.8rem",
-                                                },
-                                            ),
-                                            html.Th(
-                                                "TREND",
-                                                style={
-                                                    "color": COLORS["text_primary"],
-                                                    "fontSize": "0.8rem",
-                                                },
-                                            ),
-                                        ]
-                                    )
-                                ),
-                                html.Tbody(
-                                    id="enhanced-most-active-devices-table-body"
-                                ),
-                            ],
-                            style={"width": "100%", "fontSize": "0.9rem"},
-                        )
-                    ]
+                        html.Thead(
+                            html.Tr(
+                                [
+                                    html.Th(
+                                        "DEVICE",
+                                        style={
+                                            "color": COLORS["text_primary"],
+                                            "fontSize": "0.8rem",
+                                        },
+                                    ),
+                                    html.Th(
+                                        "EVENTS",
+                                        style={
+                                            "color": COLORS["text_primary"],
+                                            "fontSize": "0.8rem",
+                                        },
+                                    ),
+                                    html.Th(
+                                        "TREND",
+                                        style={
+                                            "color": COLORS["text_primary"],
+                                            "fontSize": "0.8rem",
+                                        },
+                                    ),
+                                ]
+                            )
+                        ),
+                        html.Tbody(
+                            id="enhanced-most-active-devices-table-body"
+                        ),
+                    ],
+                    style={"width": "100%", "fontSize": "0.9rem"},
                 ),
             ],
             style=panel_style,
@@ -399,8 +389,7 @@ class EnhancedStatsComponent:
 
     def create_peak_activity_panel(self):
         """New panel for peak activity analysis"""
-        panel_style = self.panel_style_base.copy()
-        panel_style["borderLeft"] = f'5px solid {COLORS["success"]}'
+        panel_style = merged(self.panel_style_base, {"borderLeft": f'5px solid {COLORS["success"]}'})
 
         return html.Div(
             [
@@ -455,8 +444,7 @@ class EnhancedStatsComponent:
     
     def create_security_distribution_panel(self):
         """New panel for security level distribution"""
-        panel_style = self.panel_style_base.copy()
-        panel_style["borderLeft"] = f'5px solid {COLORS["critical"]}'
+        panel_style = merged(self.panel_style_base, {"borderLeft": f'5px solid {COLORS["critical"]}'})
 
         return html.Div(
             [
@@ -507,8 +495,7 @@ class EnhancedStatsComponent:
 
     def create_user_patterns_panel(self):
         """New panel for user behavior patterns"""
-        panel_style = self.panel_style_base.copy()
-        panel_style["borderLeft"] = f'5px solid {COLORS["accent"]}'
+        panel_style = merged(self.panel_style_base, {"borderLeft": f'5px solid {COLORS["accent"]}'})
 
         return html.Div(
             [
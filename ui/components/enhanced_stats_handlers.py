@@ -38,13 +38,10 @@ class EnhancedStatsHandlers:
                 Input('stats-refresh-interval', 'n_intervals'),
                 Input('refresh-stats-btn', 'n_clicks'),
             ],
-            [
-                State('processed-data-store', 'data'),
-                State('enhanced-metrics-store', 'data'),
-            ],
+            State('enhanced-metrics-store', 'data'),
             prevent_initial_call=True
         )
-        def update_enhanced_stats(n_intervals, refresh_clicks, processed_data, enhanced_metrics):
+        def update_enhanced_stats(n_intervals, refresh_clicks, enhanced_metrics):
             """Update enhanced statistics display"""
             try:
                 if enhanced_metrics:
@@ -4,37 +4,64 @@ Graph visualization component for Cytoscape network display
 Extracted from core_layout.py and graph_callbacks.py
 """
 
-from dash import html, dcc
-import dash_cytoscape as cyto
-from ui.themes.style_config import COLORS
+import os
+from functools import lru_cache
+from dash import html, dcc, Input, Output, State
+from ui.themes.style_config import COLORS, TYPOGRAPHY
 from ui.themes.graph_styles import (
     centered_graph_box_style,
     cytoscape_inside_box_style,
     tap_node_data_centered_style,
-    actual_default_stylesheet_for_graph
+    actual_default_stylesheet_for_graph,
+    GRAPH_STYLES_LITE
 )
 
+# 'cytoscape' (default) or 'lite' for label-free rendering of very large graphs
+GRAPH_BACKEND = os.getenv('YOSAI_GRAPH_BACKEND', 'cytoscape').lower()
+
+# Overlay shown over the live graph while new elements are computed
+_GRAPH_SPINNER_STYLE = {
+    'display': 'none',
+    'flexDirection': 'column',
+    'alignItems': 'center',
+    'justifyContent': 'center',
+    'position': 'absolute',
+    'top': 0,
+    'left': 0,
+    'width': '100%',
+    'height': '100%',
+    'color': COLORS['text_secondary'],
+    'fontSize': TYPOGRAPHY['text_lg'],
+    'backgroundColor': 'rgba(15, 20, 25, 0.6)',
+    'zIndex': 10
+}
+
+
+@lru_cache(maxsize=None)
+def _load_cytoscape():
+    """Import dash_cytoscape on first use and register the extra layouts"""
+    import dash_cytoscape as cyto
+    # fcose ships in the extra layouts bundle, not the core one
+    cyto.load_extra_layouts()
+    return cyto
+
 
 class GraphComponent:
     """Centralized graph component with all visualization elements"""
     
     def __init__(self):
         self.default_layout = {
-            'name': 'cose',
-            'idealEdgeLength': 100,
-            'nodeOverlap': 20,
-            'refresh': 20,
+            'name': 'fcose',
+            'quality': 'default',
+            'uniformNodeDimensions': True,
+            'packComponents': True,
+            'nodeSeparation': 150,
+            'nodeRepulsion': 8000,
+            'idealEdgeLength': 80,
             'fit': True,
             'padding': 30,
-            'randomize': False,
-            'componentSpacing': 100,
-            'nodeRepulsion': 400000,
-            'edgeElasticity': 100,
-            'nestingFactor': 5,
-            'gravity': 80,
-            'numIter': 1000,
-            'coolingFactor': 0.95,
-            'minTemp': 1.0
+            'animate': False,
+            'randomize': False
         }
     
     def create_graph_container(self):
@@ -44,6 +71,7 @@ class GraphComponent:
             style={'display': 'none'},
             children=[
                 self.create_graph_title(),
+                self.create_expand_button(),
                 self.create_graph_area(),
                 self.create_node_info_display()
             ]
@@ -62,24 +90,63 @@ class GraphComponent:
             }
         )
     
+    def create_expand_button(self):
+        """Creates the button that expands coarsened floor (or layer) groups into doors"""
+        return html.Div(
+            html.Button(
+                "Expand All Floors",
+                id='expand-all-button',
+                style={
+                    'backgroundColor': COLORS['accent'],
+                    'color': 'white',
+                    'border': 'none',
+                    'padding': '8px 16px',
+                    'borderRadius': '4px'
+                }
+            ),
+            style={'textAlign': 'center', 'marginBottom': '10px'}
+        )
+    
     def create_graph_area(self):
         """Creates the main Cytoscape graph area"""
         return html.Div(
             id='cytoscape-graphs-area',
             style=centered_graph_box_style,
             children=[
-                self.create_cytoscape_graph()
+                # The Cytoscape instance stays mounted; only its elements are swapped
+                html.Div(
+                    id='graph-loading-wrap',
+                    style={'width': '100%', 'height': '100%'},
+                    children=[self.create_cytoscape_graph()]
+                ),
+                html.Div("Updating graph…", id='graph-spinner', style=_GRAPH_SPINNER_STYLE),
+                # Busy flag: set when a graph rebuild starts, cleared by the callback that
+                # writes onion-graph.elements; the spinner only follows this flag
+                dcc.Store(id='graph-loading', data=False)
             ]
         )
     
     def create_cytoscape_graph(self):
         """Creates the Cytoscape graph component"""
+        cyto = _load_cytoscape()
+        stylesheet = GRAPH_STYLES_LITE if GRAPH_BACKEND == 'lite' else actual_default_stylesheet_for_graph
         return cyto.Cytoscape(
             id='onion-graph',
             layout=self.default_layout,
             style=cytoscape_inside_box_style,
             elements=[],
-            stylesheet=actual_default_stylesheet_for_graph
+            stylesheet=stylesheet,
+            # Read-only view: skip grab/select bookkeeping on every node
+            userZoomingEnabled=True,
+            userPanningEnabled=True,
+            boxSelectionEnabled=False,
+            autoungrabify=True,
+            autounselectify=True,
+            responsive=True,
+            # Bound zoom so extreme levels can't trigger runaway redraws
+            wheelSensitivity=0.2,
+            minZoom=0.1,
+            maxZoom=5
         )
     
     def create_node_info_display(self):
@@ -111,13 +178,14 @@ class GraphComponent:
             dcc.Dropdown(
                 id='graph-layout-selector',
                 options=[
+                    {'label': 'fCoSE (Fast force-directed)', 'value': 'fcose'},
                     {'label': 'COSE (Force-directed)', 'value': 'cose'},
                     {'label': 'Circle', 'value': 'circle'},
                     {'label': 'Grid', 'value': 'grid'},
                     {'label': 'Breadthfirst', 'value': 'breadthfirst'},
                     {'label': 'Concentric', 'value': 'concentric'}
                 ],
-                value='cose',
+                value='fcose',
                 style={'backgroundColor': COLORS['background'], 'color': COLORS['text_primary']}
             )
         ], style={'marginBottom': '15px'})
@@ -198,6 +266,7 @@ class GraphComponent:
     def get_layout_options(self):
         """Returns available layout options"""
         return {
+            'fcose': dict(self.default_layout),
             'cose': {
                 'name': 'cose',
                 'idealEdgeLength': 100,
@@ -301,12 +370,81 @@ def create_graph_component():
     return GraphComponent()
 
 # Convenience functions for individual elements (backward compatibility)
+@lru_cache(maxsize=None)
 def create_graph_container():
     """Create the graph container"""
     component = GraphComponent()
     return component.create_graph_container()
 
+@lru_cache(maxsize=None)
 def create_cytoscape_graph():
     """Create just the Cytoscape graph"""
     component = GraphComponent()
-    return component.create_cytoscape_graph()
\ No newline at end of file
+    return component.create_cytoscape_graph()
+
+def register_graph_callbacks(app):
+    """Browser-side graph callbacks: the loading spinner and floor-group expansion
+    
+    The spinner follows the graph-loading store. Apps that rebuild the graph set the
+    flag with register_graph_loading_trigger and clear it from the data callback.
+    """
+    app.clientside_callback(
+        """
+        function(busy, style) {
+            return Object.assign({}, style, {display: busy ? 'flex' : 'none'});
+        }
+        """,
+        Output('graph-spinner', 'style'),
+        Input('graph-loading', 'data'),
+        State('graph-spinner', 'style'),
+        prevent_initial_call=True
+    )
+
+    # Unpack the floor (or layer) groups built by coarsen_cytoscape_elements in place
+    app.clientside_callback(
+        """
+        function(n_clicks, elements) {
+            const nodes = [];
+            const edges = [];
+            let expanded = false;
+            (elements || []).forEach(function(el) {
+                const d = el.data || {};
+                if (d.members) {
+                    expanded = true;
+                    nodes.push({data: {id: d.id, label: d.label}, classes: el.classes});
+                    d.members.forEach(function(m) {
+                        nodes.push({data: Object.assign({}, m.data, {parent: d.id}), classes: m.classes});
+                    });
+                    edges.push.apply(edges, d.edges || []);
+                } else if (d.edges) {
+                    expanded = true;
+                    edges.push.apply(edges, d.edges);
+                } else if (d.source) {
+                    edges.push(el);
+                } else {
+                    nodes.push(el);
+                }
+            });
+            return expanded ? nodes.concat(edges) : window.dash_clientside.no_update;
+        }
+        """,
+        Output('onion-graph', 'elements', allow_duplicate=True),
+        Input('expand-all-button', 'n_clicks'),
+        State('onion-graph', 'elements'),
+        prevent_initial_call=True
+    )
+
+
+def register_graph_loading_trigger(app, trigger_id):
+    """Set the graph-loading flag when `trigger_id` is clicked
+    
+    Only register this next to the callback that writes onion-graph.elements for that
+    click; that callback must also clear the flag (Output('graph-loading', 'data',
+    allow_duplicate=True) -> False), or the spinner never goes away.
+    """
+    app.clientside_callback(
+        "function(n_clicks) { return Boolean(n_clicks); }",
+        Output('graph-loading', 'data'),
+        Input(trigger_id, 'n_clicks'),
+        prevent_initial_call=True
+    )
@@ -1,8 +1,48 @@
 #!/usr/bin/env python3
-# test_magic.py
+# magic_check.py
 """
 Test if python-magic is working correctly on macOS
 """
+import os
+import sys
+from pathlib import Path
+
+
+def _magic_cache_dir():
+    """Where the "python-magic verified" marker lives, or None when caching is off
+    
+    YOSAI_CACHE_DIR wins, then $XDG_CACHE_HOME/wsg23, then ~/.cache/wsg23. Set
+    YOSAI_MAGIC_CACHE=0 to disable; it is also off under pytest and on CI so
+    test runs never write to $HOME.
+    """
+    if (os.getenv('YOSAI_MAGIC_CACHE', '1') == '0'
+            or 'PYTEST_CURRENT_TEST' in os.environ or os.getenv('CI')):
+        return None
+    if os.getenv('YOSAI_CACHE_DIR'):
+        return Path(os.environ['YOSAI_CACHE_DIR'])
+    return Path(os.getenv('XDG_CACHE_HOME') or Path.home() / ".cache") / "wsg23"
+
+
+def _magic_cache_path(magic_module):
+    """Marker file keyed on the Python and python-magic versions (None when caching is off)"""
+    cache_dir = _magic_cache_dir()
+    if cache_dir is None:
+        return None
+    py_version = "{}.{}.{}".format(*sys.version_info[:3])
+    magic_version = getattr(magic_module, "__version__", "unknown")
+    return cache_dir / f"magic_ok-py{py_version}-magic{magic_version}"
+
+
+def _mark_magic_verified(cache_path):
+    """Best effort: a read-only cache directory just means the sniff runs again next time"""
+    if cache_path is None:
+        return
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(b"1")
+    except OSError:
+        pass
+
 
 def test_python_magic():
     """Test python-magic functionality"""
@@ -12,6 +52,12 @@ def test_python_magic():
         import magic
         print("✅ python-magic module imported successfully")
         
+        # Skip the sniff if this environment already passed it
+        cache_path = _magic_cache_path(magic)
+        if cache_path is not None and cache_path.exists():
+            print("✅ python-magic previously verified (cached)")
+            return True
+        
         # Test creating magic instance
         m = magic.Magic(mime=True)
         print("✅ Magic instance created successfully")
@@ -23,6 +69,7 @@ def test_python_magic():
         
         if mime_type in ['text/csv', 'text/plain']:
             print("🎉 python-magic is working perfectly!")
+            _mark_magic_verified(cache_path)
             return True
         else:
             print(f"⚠️ Unexpected MIME type: {mime_type} (but still working)")
@@ -14,9 +14,12 @@ from dash import Input, Output, State, html, no_update
 from config.settings.py import REQUIRED_INTERNAL_COLUMNS
 from utils.logging_config import get_logger
 from ui.themes.style_config import UPLOAD_STYLES, get_interactive_setup_style
+from ui.themes.helpers import merged
 
 logger = get_logger(__name__)
 
+_HIDDEN = {'display': 'none'}
+
 class SecureUploadHandlers:
     """Enhanced upload handlers with security validation"""
 
@@ -61,8 +64,7 @@ class SecureUploadHandlers:
             # Initial state values
             hide_style = {'display': 'none'}
             show_interactive_setup_style = get_interactive_setup_style(True)
-            confirm_button_style_hidden = UPLOAD_STYLES['generate_button'].copy()
-            confirm_button_style_hidden['display'] = 'none'
+            confirm_button_style_hidden = merged(UPLOAD_STYLES['generate_button'], _HIDDEN)
             upload_icon_style = UPLOAD_STYLES['icon']
 
             if contents is None:
@@ -132,8 +134,7 @@ class SecureUploadHandlers:
                 mapping_dropdowns = self._create_mapping_dropdowns(headers, loaded_col_map_prefs)
                 
                 # Success response
-                confirm_button_style_visible = confirm_button_style_hidden.copy()
-                confirm_button_style_visible['display'] = 'block'
+                confirm_button_style_visible = merged(confirm_button_style_hidden, {'display': 'block'})
                 
                 processing_status_msg = f"Step 1: Confirm Header Mapping for '{filename}'."
                 
@@ -13,25 +13,41 @@ from plotly.graph_objs import Figure  # For proper type hints
 import pandas as pd
 import base64
 import io
+from collections import ChainMap
+from functools import lru_cache
 from datetime import datetime
 from typing import Optional
 from ui.themes.style_config import COLORS, UI_VISIBILITY, SPACING, BORDER_RADIUS, SHADOWS
 from config.settings.py import SECURITY_LEVELS
 
+# Default metrics, shared by the empty dashboard and the summary report so both show the same values
+_DEFAULT_STATS = {
+    'total_events': 0,
+    'unique_users': 0,
+    'unique_devices': 0,
+    'date_range': "N/A",
+    'avg_events_per_day': "N/A",
+    'peak_hour': "N/A",
+    'peak_day': "N/A",
+    'peak_activity_day': "N/A",
+    'avg_events_per_user': "N/A",
+    'most_active_user': "N/A",
+    'avg_users_per_device': "N/A",
+    'total_devices_count': "0 devices",
+    'entrance_devices_count': "0 entrances",
+    'high_security_devices': "0 high security",
+    'busiest_floor': "N/A",
+    'traffic_pattern': "No Data",
+    'security_score': "N/A",
+    'efficiency_score': "N/A",
+    'anomaly_count': 0,
+    'security_breakdown': {},
+}
+
 class EnhancedStatsComponent:
     """Enhanced statistics component with advanced analytics and visualizations"""
     
     def __init__(self):
-        self.panel_style_base = {
-            'flex': '1',
-            'padding': '20px',
-            'margin': '0 10px',
-            'backgroundColor': COLORS['surface'],
-            'borderRadius': '8px',
-            'textAlign': 'center',
-            'boxShadow': '2px 2px 5px rgba(0,0,0,0.2)'
-        }
-        
         # Chart color palette matching theme
         self.chart_colors = [
             COLORS['accent'], COLORS['success'], COLORS['warning'],
@@ -87,42 +103,33 @@ class EnhancedStatsComponent:
     
     def create_enhanced_access_events_panel(self):
         """Enhanced access events panel with additional metrics"""
-        panel_style = self.panel_style_base.copy()
-        panel_style['borderLeft'] = f'5px solid {COLORS["accent"]}'
-        
         return html.Div([
-            html.H3("Access Events", style={'color': COLORS['text_primary']}),
+            html.H3("Access Events", className='card-title'),
             html.H1(id="total-access-events-H1", style={'color': COLORS['text_primary']}),
-            html.P(id="event-date-range-P", style={'color': COLORS['text_secondary']}),
+            html.P(id="event-date-range-P", className='card-subtext'),
             # NEW: Additional metrics
-            html.P(id="avg-events-per-day", style={'color': COLORS['text_secondary'], 'fontSize': '0.9rem'}),
-            html.P(id="peak-activity-day", style={'color': COLORS['text_secondary'], 'fontSize': '0.9rem'})
-        ], style=panel_style)
+            html.P(id="avg-events-per-day", className='card-subtext small'),
+            html.P(id="peak-activity-day", className='card-subtext small')
+        ], className='stat-panel accent')
     
     def create_enhanced_statistics_panel(self):
         """Enhanced statistics panel with user analytics"""
-        panel_style = self.panel_style_base.copy()
-        panel_style['borderLeft'] = f'5px solid {COLORS["warning"]}'
-        
         return html.Div([
-            html.H3("User Analytics", style={'color': COLORS['text_primary']}),
-            html.P(id="stats-unique-users", style={'color': COLORS['text_secondary']}),
-            html.P(id="stats-avg-events-per-user", style={'color': COLORS['text_secondary']}),
-            html.P(id="stats-most-active-user", style={'color': COLORS['text_secondary']}),
-            html.P(id="stats-devices-per-user", style={'color': COLORS['text_secondary']}),
-            html.P(id="stats-peak-hour", style={'color': COLORS['text_secondary']})
-        ], style=panel_style)
+            html.H3("User Analytics", className='card-title'),
+            html.P(id="stats-unique-users", className='card-subtext'),
+            html.P(id="stats-avg-events-per-user", className='card-subtext'),
+            html.P(id="stats-most-active-user", className='card-subtext'),
+            html.P(id="stats-devices-per-user", className='card-subtext'),
+            html.P(id="stats-peak-hour", className='card-subtext')
+        ], className='stat-panel warning')
     
     def create_enhanced_active_devices_panel(self):
         """Enhanced active devices panel with floor breakdown"""
-        panel_style = self.panel_style_base.copy()
-        panel_style['borderLeft'] = f'5px solid {COLORS["critical"]}'
-        
         return html.Div([
-            html.H3("Device Analytics", style={'color': COLORS['text_primary']}),
-            html.P(id="total-devices-count", style={'color': COLORS['text_secondary']}),
-            html.P(id="entrance-devices-count", style={'color': COLORS['text_secondary']}),
-            html.P(id="high-security-devices", style={'color': COLORS['text_secondary']}),
+            html.H3("Device Analytics", className='card-title'),
+            html.P(id="total-devices-count", className='card-subtext'),
+            html.P(id="entrance-devices-count", className='card-subtext'),
+            html.P(id="high-security-devices", className='card-subtext'),
             html.Table([
                 html.Thead(html.Tr([
                     html.Th("DEVICE", style={'color': COLORS['text_primary'], 'fontSize': '0.8rem'}),
@@ -130,41 +137,34 @@ class EnhancedStatsComponent:
                 ])),
                 html.Tbody(id='most-active-devices-table-body')
             ], style={'fontSize': '0.85rem'})
-        ], style=panel_style)
+        ], className='stat-panel critical')
     
     def create_peak_activity_panel(self):
         """NEW: Peak activity analysis panel"""
-        panel_style = self.panel_style_base.copy()
-        panel_style['borderLeft'] = f'5px solid {COLORS["success"]}'
-        
         return html.Div([
-            html.H3("Peak Activity", style={'color': COLORS['text_primary']}),
-            html.P(id="peak-hour-display", style={'color': COLORS['text_secondary']}),
-            html.P(id="peak-day-display", style={'color': COLORS['text_secondary']}),
-            html.P(id="busiest-floor", style={'color': COLORS['text_secondary']}),
-            html.P(id="entry-exit-ratio", style={'color': COLORS['text_secondary']}),
-            html.P(id="weekend-vs-weekday", style={'color': COLORS['text_secondary']})
-        ], style=panel_style)
+            html.H3("Peak Activity", className='card-title'),
+            html.P(id="peak-hour-display", className='card-subtext'),
+            html.P(id="peak-day-display", className='card-subtext'),
+            html.P(id="busiest-floor", className='card-subtext'),
+            html.P(id="entry-exit-ratio", className='card-subtext'),
+            html.P(id="weekend-vs-weekday", className='card-subtext')
+        ], className='stat-panel success')
     
     def create_security_overview_panel(self):
         """NEW: Security metrics panel"""
-        panel_style = self.panel_style_base.copy()
-        panel_style['borderLeft'] = f'5px solid {COLORS["info"]}'
-        
         return html.Div([
-            html.H3("Security Overview", style={'color': COLORS['text_primary']}),
+            html.H3("Security Overview", className='card-title'),
             html.Div(id="security-level-breakdown", children=[
-                html.P("Security analysis loading...", style={'color': COLORS['text_secondary']})
+                html.P("Security analysis loading...", className='card-subtext')
             ]),
-            html.P(id="compliance-score", style={'color': COLORS['text_secondary']}),
-            html.P(id="anomaly-alerts", style={'color': COLORS['text_secondary']})
-        ], style=panel_style)
+            html.P(id="compliance-score", className='card-subtext'),
+            html.P(id="anomaly-alerts", className='card-subtext')
+        ], className='stat-panel info')
     
     def create_analytics_section(self):
         """NEW: Advanced analytics section with key insights"""
         return html.Div([
-            html.H4("Advanced Analytics",
-                   style={'color': COLORS['text_primary'], 'textAlign': 'center', 'marginBottom': '20px'}),
+            html.H4("Advanced Analytics", className='section-header'),
             
             html.Div([
                 # Insights cards
@@ -182,22 +182,15 @@ class EnhancedStatsComponent:
             # Detailed breakdown
             html.Div(id="analytics-detailed-breakdown")
             
-        ], id='analytics-section', style={            
-            'padding': '20px',
-            'backgroundColor': COLORS['surface'],
-            'borderRadius': '8px',
-            'margin': '20px 0',
-            'border': f'1px solid {COLORS["border"]}'
-        })
+        ], id='analytics-section', className='stats-section')
     
     def create_charts_section(self):
         """NEW: Interactive charts section"""
         return html.Div(
             id='charts-section',
-            className='charts-section',
+            className='charts-section stats-section',
             children=[
-                html.H4("Data Visualization",
-                       style={'color': COLORS['text_primary'], 'textAlign': 'center', 'marginBottom': '20px'}),
+                html.H4("Data Visualization", className='section-header'),
             
             # Chart controls
             html.Div([
@@ -238,13 +231,7 @@ class EnhancedStatsComponent:
                 ], style={'flex': '1', 'margin': '0 10px'})
             ], style={'display': 'flex', 'marginTop': '20px'})
 
-        ], style={
-            'padding': '20px',
-            'backgroundColor': COLORS['surface'],
-            'borderRadius': '8px',
-            'margin': '20px 0',
-            'border': f'1px solid {COLORS["border"]}'
-        })
+        ])
 
     def create_mini_graph_container(self):
         """Small graph container with unique IDs to avoid duplicates"""
@@ -257,7 +244,9 @@ class EnhancedStatsComponent:
                     layout={'name': 'cose', 'fit': True},
                     style={'width': '100%', 'height': '300px'},
                     elements=[],
-                    stylesheet=actual_default_stylesheet_for_graph
+                    stylesheet=actual_default_stylesheet_for_graph,
+                    autoungrabify=True,
+                    autounselectify=True
                 )
             ]
         )
@@ -266,9 +255,9 @@ class EnhancedStatsComponent:
         """NEW: Export and download section"""
         return html.Div(
             id='export-section',
+            className='stats-section',
             children=[
-            html.H4("Export & Reports",
-                   style={'color': COLORS['text_primary'], 'textAlign': 'center', 'marginBottom': '20px'}),
+            html.H4("Export & Reports", className='section-header'),
             
             html.Div([
                 html.Button(
@@ -310,13 +299,7 @@ class EnhancedStatsComponent:
             # Export status
             html.Div(id="export-status", style={'textAlign': 'center', 'marginTop': '10px'})
             
-        ], style={
-            'padding': '20px',
-            'backgroundColor': COLORS['surface'],
-            'borderRadius': '8px',
-            'margin': '20px 0',
-            'border': f'1px solid {COLORS["border"]}'
-        })
+        ])
     
     def create_insight_card(self, title, content_id, color):
         """Create a small insight card"""
@@ -711,28 +694,7 @@ class EnhancedStatsComponent:
     
     def get_default_enhanced_stats(self):
         """Default values for enhanced statistics"""
-        return {
-            'total_events': 0,
-            'unique_users': 0,
-            'unique_devices': 0,
-            'date_range': "N/A",
-            'avg_events_per_day': "N/A",
-            'peak_hour': "N/A",
-            'peak_day': "N/A",
-            'peak_activity_day': "N/A",
-            'avg_events_per_user': "N/A",
-            'most_active_user': "N/A",
-            'avg_users_per_device': "N/A",
-            'total_devices_count': "0 devices",
-            'entrance_devices_count': "0 entrances",
-            'high_security_devices': "0 high security",
-            'busiest_floor': "N/A",
-            'traffic_pattern': "No Data",
-            'security_score': "N/A",
-            'efficiency_score': "N/A",
-            'anomaly_count': 0,
-            'security_breakdown': {}
-        }
+        return {**_DEFAULT_STATS, 'security_breakdown': {}}
     
     # Export functionality
     def export_stats_to_csv(self, metrics_data):
@@ -764,54 +726,54 @@ class EnhancedStatsComponent:
             return "No data available for report generation."
         
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        m = ChainMap(metrics_data, _DEFAULT_STATS)
         
         report = f"""
 # Enhanced Analytics Report
 Generated: {timestamp}
 
 ## Summary Statistics
-- Total Access Events: {metrics_data.get('total_events', 'N/A')}
-- Unique Users: {metrics_data.get('unique_users', 'N/A')}
-- Unique Devices: {metrics_data.get('unique_devices', 'N/A')}
-- Date Range: {metrics_data.get('date_range', 'N/A')}
+- Total Access Events: {m['total_events']}
+- Unique Users: {m['unique_users']}
+- Unique Devices: {m['unique_devices']}
+- Date Range: {m['date_range']}
 
 ## Activity Analysis
-- {metrics_data.get('avg_events_per_day', 'N/A')}
-- {metrics_data.get('peak_hour', 'N/A')}
-- {metrics_data.get('peak_day', 'N/A')}
-- Peak Activity Day: {metrics_data.get('peak_activity_day', 'N/A')}
+- {m['avg_events_per_day']}
+- {m['peak_hour']}
+- {m['peak_day']}
+- Peak Activity Day: {m['peak_activity_day']}
 
 ## User Analytics
-- {metrics_data.get('avg_events_per_user', 'N/A')}
-- {metrics_data.get('most_active_user', 'N/A')}
-- {metrics_data.get('avg_users_per_device', 'N/A')}
+- {m['avg_events_per_user']}
+- {m['most_active_user']}
+- {m['avg_users_per_device']}
 
 ## Device & Security
-- {metrics_data.get('total_devices_count', 'N/A')}
-- {metrics_data.get('entrance_devices_count', 'N/A')}
-- {metrics_data.get('high_security_devices', 'N/A')}
-- Busiest Floor: {metrics_data.get('busiest_floor', 'N/A')}
+- {m['total_devices_count']}
+- {m['entrance_devices_count']}
+- {m['high_security_devices']}
+- Busiest Floor: {m['busiest_floor']}
 
 ## Advanced Insights
-- Traffic Pattern: {metrics_data.get('traffic_pattern', 'N/A')}
-- Security Score: {metrics_data.get('security_score', 'N/A')}
-- Efficiency Rating: {metrics_data.get('efficiency_score', 'N/A')}
-- Anomaly Alerts: {metrics_data.get('anomaly_count', 0)} detected
+- Traffic Pattern: {m['traffic_pattern']}
+- Security Score: {m['security_score']}
+- Efficiency Rating: {m['efficiency_score']}
+- Anomaly Alerts: {m['anomaly_count']} detected
 
 ## Security Level Distribution
 """
         
-        if 'security_breakdown' in metrics_data:
-            for level, count in metrics_data['security_breakdown'].items():
-                report += f"- {level.title()}: {count} devices\n"
+        for level, count in m['security_breakdown'].items():
+            report += f"- {level.title()}: {count} devices\n"
         
         report += f"""
 ## Recommendations
 Based on the analysis, consider:
-1. Monitor peak hours ({metrics_data.get('peak_hour', 'N/A')}) for capacity planning
-2. Review security policies for {metrics_data.get('high_security_devices', '0')} high-security devices
-3. Investigate {metrics_data.get('anomaly_count', 0)} anomalous activity patterns
-4. Optimize access flows on busiest floor: {metrics_data.get('busiest_floor', 'N/A')}
+1. Monitor peak hours ({m['peak_hour']}) for capacity planning
+2. Review security policies for {m['high_security_devices']} high-security devices
+3. Investigate {m['anomaly_count']} anomalous activity patterns
+4. Optimize access flows on busiest floor: {m['busiest_floor']}
 
 ---
 Report generated by Enhanced Analytics Dashboard
@@ -829,11 +791,13 @@ def create_enhanced_stats_component():
 StatsComponent = EnhancedStatsComponent  # Alias for existing code
 
 # Convenience functions
+@lru_cache(maxsize=None)
 def create_stats_container():
     """Create the enhanced stats container"""
     component = EnhancedStatsComponent()
     return component.create_enhanced_stats_container()
 
+@lru_cache(maxsize=None)
 def create_custom_header(main_logo_path):
     """Create the enhanced custom header"""
     component = EnhancedStatsComponent()
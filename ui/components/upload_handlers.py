@@ -16,6 +16,7 @@ from ui.components.upload import create_upload_component
 from ui.themes.graph_styles import upload_icon_img_style
 
 from ui.themes.style_config import UPLOAD_STYLES, MAPPING_STYLES, get_interactive_setup_style
+from ui.themes.helpers import merged
 # Import required column mapping from unified settings
 from config.settings.py import REQUIRED_INTERNAL_COLUMNS
 
@@ -23,6 +24,8 @@ from config.settings.py import REQUIRED_INTERNAL_COLUMNS
 from utils.logging_config import get_logger
 logger = get_logger(__name__)                 
 
+_HIDDEN = {'display': 'none'}
+
 class UploadHandlers:
     """Handles all upload-related callbacks and business logic"""
     
@@ -188,8 +191,7 @@ class UploadHandlers:
         """Get initial state values for all outputs"""
         hide_style = {'display': 'none'}
         show_interactive_setup_style = get_interactive_setup_style(True)
-        confirm_button_style_hidden = UPLOAD_STYLES['generate_button'].copy()
-        confirm_button_style_hidden['display'] = 'none'
+        confirm_button_style_hidden = merged(UPLOAD_STYLES['generate_button'], _HIDDEN)
         
         return (
             None, None, [],  # file store, headers, dropdown area
@@ -240,8 +242,7 @@ class UploadHandlers:
         """Create response for failed upload"""
         hide_style = {'display': 'none'}
         show_interactive_setup_style = get_interactive_setup_style(True)
-        confirm_button_style_hidden = UPLOAD_STYLES['generate_button'].copy()
-        confirm_button_style_hidden['display'] = 'none'
+        confirm_button_style_hidden = merged(UPLOAD_STYLES['generate_button'], _HIDDEN)
         
         error_message = result.get('error', 'Unknown error')
         processing_status_msg = f"Error processing '{filename}': {error_message}"
@@ -1,103 +1,102 @@
+import os
 import dash
-from dash import Dash, html, dcc, Input, Output
-from ui.components.upload import create_enhanced_upload_component
-from ui.components.classification import create_classification_component
-from ui.components.graph import create_graph_component
+from functools import lru_cache
+from dash import Dash, html, dcc, Input, Output, ClientsideFunction
 
-# Temporary Dash app to get the asset URL for custom.css
-_tmp = Dash(__name__)
-CUSTOM_CSS = _tmp.get_asset_url("custom.css")
+_classification_component = None
 
-# Main Dash app with external stylesheet
-app = Dash(__name__, external_stylesheets=[CUSTOM_CSS])
+# Upload icons in (default, success, fail) order, resolved per app via get_asset_url
+_UPLOAD_ICON_ASSETS = (
+    "upload_file_csv_icon.png",
+    "upload_file_csv_icon_success.png",
+    "upload_file_csv_icon_fail.png",
+)
 
 
+# (index, title, value, subtext) for each overview card. Values and subtexts
+# use pattern-matching ids so one callback can refresh every card via ALL.
+_OVERVIEW_PANELS = (
+    ("access", "Access Events", "2,161", "21.01.2025 – 21.01.2025"),
+    ("device", "Device Analytics", "Total: 4 devices", "Access Granted: 432"),
+    ("peak", "Peak Activity", "Peak: 9:00", "Busiest: Tuesday"),
+)
+
+# (index, title, graph id) for each advanced card
+_ADVANCED_PANELS = (
+    ("traffic", "Traffic Pattern", "graph-traffic"),
+    ("security", "Security Score", "graph-security-score"),
+    ("usage", "Usage Efficiency", "graph-usage"),
+    ("anomaly", "Anomaly Detection", "graph-anomaly"),
+)
+
+# (label, id) for the export tab buttons
+_EXPORT_BUTTONS = (
+    ("📊 Export Stats CSV", "export-csv"),
+    ("📉 Download Charts", "download-charts"),
+    ("🧾 Generate Report", "generate-report"),
+    ("🔄 Refresh Data", "refresh-data"),
+)
+
+# (label, id, colour) for the advanced analytics toggles in the card grid
+_ANALYTICS_TOGGLES = (
+    ("Traffic Pattern", "toggle-traffic-pattern", "blue"),
+    ("Security Score", "toggle-security-score", "green"),
+    ("Usage Efficiency", "toggle-usage-efficiency", "yellow"),
+    ("Anomaly Detection", "toggle-anomaly-detection", "red"),
+)
+
+
+# Tab bodies are static, so build each tree once and reuse it
+@lru_cache(maxsize=None)
 def overview_layout():
     return html.Div(
         id="overview-content",
         children=[
             html.Div(
-                id="stats-panels-container",
+                id="overview-panels-container",
+                className="stats-panels-container",
                 children=[
                     html.Div(
-                        id="card-access",
-                        className="stat-card",
-                        children=[
-                            html.H3("Access Events", className="card-title"),
-                            html.H4("2,161", className="card-value"),
-                            html.Div("21.01.2025 – 21.01.2025", className="card-subtext"),
-                        ],
-                    ),
-                    html.Div(
-                        id="card-device",
-                        className="stat-card",
-                        children=[
-                            html.H3("Device Analytics", className="card-title"),
-                            html.H4("Total: 4 devices", className="card-value"),
-                            html.Div("Access Granted: 432", className="card-subtext"),
-                        ],
-                    ),
-                    html.Div(
-                        id="card-peak",
+                        id=f"card-{index}",
                         className="stat-card",
                         children=[
-                            html.H3("Peak Activity", className="card-title"),
-                            html.H4("Peak: 9:00", className="card-value"),
-                            html.Div("Busiest: Tuesday", className="card-subtext"),
+                            html.H3(title, className="card-title"),
+                            html.H4(value, id={"type": "stat-value", "index": index}, className="card-value"),
+                            html.Div(subtext, id={"type": "stat-subtext", "index": index}, className="card-subtext"),
                         ],
-                    ),
+                    )
+                    for index, title, value, subtext in _OVERVIEW_PANELS
                 ],
             )
         ],
     )
 
 
+@lru_cache(maxsize=None)
 def advanced_layout():
     return html.Div(
         id="advanced-content",
         children=[
             html.Div(
-                id="stats-panels-container",
+                id="advanced-panels-container",
+                className="stats-panels-container",
                 children=[
                     html.Div(
-                        id="card-traffic",
-                        className="stat-card",
-                        children=[
-                            html.H3("Traffic Pattern", className="card-title"),
-                            dcc.Graph(id="graph-traffic"),
-                        ],
-                    ),
-                    html.Div(
-
-                        id="card-security",
-                        className="stat-card",
-                        children=[
-                            html.H3("Security Score", className="card-title"),
-                            dcc.Graph(id="graph-security-score"),
-                        ],
-                    ),
-                    html.Div(
-                        id="card-usage",
-                        className="stat-card",
-                        children=[
-                            html.H3("Usage Efficiency", className="card-title"),
-                            dcc.Graph(id="graph-usage"),
-                        ],
-                    ),
-                    html.Div(
-                        id="card-anomaly",
+                        id=f"card-{index}",
                         className="stat-card",
                         children=[
-                            html.H3("Anomaly Detection", className="card-title"),
-                            dcc.Graph(id="graph-anomaly"),
+                            html.H3(title, className="card-title"),
+                            dcc.Graph(id=graph_id),
                         ],
-                    ),
+                    )
+                    for index, title, graph_id in _ADVANCED_PANELS
                 ],
             )
         ],
     )
 
 
+@lru_cache(maxsize=None)
 def export_layout():
     return html.Div(
         id="export-content",
@@ -105,25 +104,161 @@ def export_layout():
             html.Div(
                 id="export-buttons",
                 children=[
+                    html.Button(label, id=button_id, className="dash-button")
+                    for label, button_id in _EXPORT_BUTTONS
+                ],
+            )
+        ],
+    )
+
+
+@lru_cache(maxsize=None)
+def create_tab_content() -> html.Div:
+    """All three tabs rendered up front; switching only toggles visibility"""
+    hidden = {"display": "none"}
+    return html.Div(
+        id="tab-content",
+        children=[
+            html.Div(id="overview-wrap", children=overview_layout()),
+            html.Div(id="advanced-wrap", children=advanced_layout(), style=hidden),
+            html.Div(id="export-wrap", children=export_layout(), style=hidden),
+        ],
+    )
 
-                    html.Button("📊 Export Stats CSV", id="export-csv", className="dash-button"),
-                    html.Button("📉 Download Charts", id="download-charts", className="dash-button"),
-                    html.Button("🧾 Generate Report", id="generate-report", className="dash-button"),
-                    html.Button("🔄 Refresh Data", id="refresh-data", className="dash-button"),
 
+def _get_classification_component():
+    """Build the classification component on first render, not at import"""
+    global _classification_component
+    if _classification_component is None:
+        from ui.components.classification import create_classification_component
+        _classification_component = create_classification_component()
+    return _classification_component
+
+
+# The analytics cards do not depend on the app or its asset URLs, so build them once
+# like the tab bodies above; every layout shares this subtree, so treat it as read-only
+@lru_cache(maxsize=None)
+def _analytics_cards_row() -> html.Div:
+    return html.Div(
+        className="flex-row",
+        children=[
+            html.Div(
+                id="access-events-card",
+                className="card",
+                children=[
+                    html.H3("Access Events"),
+                    html.Div(id="total-access-events-H1"),
+                    html.Div(id="event-date-range-P"),
                 ],
-            )
+            ),
+            html.Div(
+                id="user-analytics-card",
+                className="card",
+                children=[
+                    html.H3("User Analytics"),
+                    html.Div(id="stats-unique-users"),
+                    html.Div(id="stats-avg-events-per-user"),
+                    html.Div(id="stats-most-active-user"),
+                    html.Div(id="stats-devices-per-user"),
+                    html.Div(id="stats-peak-hour"),
+                ],
+            ),
+            html.Div(
+                id="device-analytics-card",
+                className="card",
+                children=[
+                    html.H3("Device Analytics"),
+                    html.Table([
+                        html.Thead(html.Tr([html.Th("DEVICE"), html.Th("EVENTS")])),
+                        html.Tbody(id="most-active-devices-table-body"),
+                    ]),
+                    html.Div(id="total-devices-count"),
+                    html.Div(id="entrance-devices-count"),
+                    html.Div(id="high-security-devices"),
+                ],
+            ),
+            html.Div(
+                id="peak-activity-card",
+                className="card",
+                children=[
+                    html.H3("Peak Activity"),
+                    html.Div(id="peak-hour-display"),
+                    html.Div(id="peak-day-display"),
+                    html.Div(id="weekday-percent"),
+                    html.Div(id="weekend-percent"),
+                ],
+            ),
+            html.Div(
+                id="security-overview-card",
+                className="card",
+                children=[
+                    html.H3("Security Overview"),
+                    html.Div(["🟢 ", html.Span(id="security-green-count")]),
+                    html.Div(["🔴 ", html.Span(id="security-red-count")]),
+                    html.Div(["🟡 ", html.Span(id="security-yellow-count")]),
+                    html.Div(id="security-compliance"),
+                    html.Div(id="security-alerts"),
+                ],
+            ),
+            html.Div(
+                id="advanced-analytics-card",
+                className="card",
+                children=[
+                    html.H3("Advanced Analytics"),
+                    *(
+                        html.Div(label, id=toggle_id, className=f"toggle-btn {colour}")
+                        for label, toggle_id, colour in _ANALYTICS_TOGGLES
+                    ),
+                ],
+            ),
+            html.Div(
+                id="data-visualization-card",
+                className="card",
+                style={"flex": "1"},
+                children=[
+                    html.H3("Data Visualization"),
+                    html.Label("Chart Type:", htmlFor="chart-type-dropdown"),
+                    dcc.Dropdown(
+                        id="chart-type-dropdown",
+                        options=[
+                            {"label": "Hourly Activity", "value": "hourly"},
+                            {"label": "Security Distribution", "value": "security"},
+                            {"label": "Heatmap (Day vs Hour)", "value": "heatmap"},
+                        ],
+                        value="hourly",
+                        style={"width": "200px", "marginBottom": "10px"},
+                    ),
+                    dcc.Graph(id="main-chart", config={"displayModeBar": True}, style={"height": "400px"}),
+                ],
+            ),
+            html.Div(
+                id="export-reports-card",
+                className="card",
+                style={"minWidth": "200px"},
+                children=[
+                    html.H3("Export & Reports"),
+                    html.Button("📊 Export Stats CSV", id="export-csv-btn", className="btn btn-light", style={"marginBottom": "10px", "width": "100%"}),
+                    html.Button("💾 Download Charts", id="download-charts-btn", className="btn btn-light", style={"marginBottom": "10px", "width": "100%"}),
+                    html.Button("Generate Report", id="generate-report-btn", className="btn btn-primary", style={"marginBottom": "10px", "width": "100%"}),
+                    html.Button("🔄 Refresh Data", id="refresh-data-btn", className="btn btn-light", style={"width": "100%"}),
+                ],
+            ),
         ],
     )
 
 
+# Built fresh per call: callers (app.py) patch the returned tree in place, and a cache
+# keyed on the app would keep every Dash app and its server alive
 def create_main_layout(app_instance: Dash) -> html.Div:
+    # The component modules pull in dash_cytoscape, pandas and the upload
+    # parsers; only import them when the page is actually built
+    from ui.components.graph import create_graph_component
+    from ui.components.upload import create_enhanced_upload_component
+
     upload_component = create_enhanced_upload_component(
-        app_instance.get_asset_url("upload_file_csv_icon.png"),
-        app_instance.get_asset_url("upload_file_csv_icon_success.png"),
-        app_instance.get_asset_url("upload_file_csv_icon_fail.png"),
+        *(app_instance.get_asset_url(name) for name in _UPLOAD_ICON_ASSETS)
     )
-    classification_component = create_classification_component()
+    classification_component = _get_classification_component()
     graph_component = create_graph_component()
 
     return html.Div(
@@ -132,171 +267,46 @@ def create_main_layout(app_instance: Dash) -> html.Div:
             html.Div(upload_component.create_upload_area(), style={"width": "100%"}),
             classification_component.create_facility_setup_card(),
             graph_component.create_graph_container(),
-            html.Div(
-                className="flex-row",
-                children=[
-                    html.Div(
-                        id="access-events-card",
-                        className="card",
-                        children=[
-                            html.H3("Access Events"),
-                            html.Div(id="total-access-events-H1"),
-                            html.Div(id="event-date-range-P"),
-                        ],
-                    ),
-                    html.Div(
-                        id="user-analytics-card",
-                        className="card",
-                        children=[
-                            html.H3("User Analytics"),
-                            html.Div(id="stats-unique-users"),
-                            html.Div(id="stats-avg-events-per-user"),
-                            html.Div(id="stats-most-active-user"),
-                            html.Div(id="stats-devices-per-user"),
-                            html.Div(id="stats-peak-hour"),
-                        ],
-                    ),
-                    html.Div(
-                        id="device-analytics-card",
-                        className="card",
-                        children=[
-                            html.H3("Device Analytics"),
-                            html.Table([
-                                html.Thead(html.Tr([html.Th("DEVICE"), html.Th("EVENTS")])),
-                                html.Tbody(id="most-active-devices-table-body"),
-                            ]),
-                            html.Div(id="total-devices-count"),
-                            html.Div(id="entrance-devices-count"),
-                            html.Div(id="high-security-devices"),
-                        ],
-                    ),
-                    html.Div(
-                        id="peak-activity-card",
-                        className="card",
-                        children=[
-                            html.H3("Peak Activity"),
-                            html.Div(id="peak-hour-display"),
-                            html.Div(id="peak-day-display"),
-                            html.Div(id="weekday-percent"),
-                            html.Div(id="weekend-percent"),
-                        ],
-                    ),
-                    html.Div(
-                        id="security-overview-card",
-                        className="card",
-                        children=[
-                            html.H3("Security Overview"),
-                            html.Div(["🟢 ", html.Span(id="security-green-count")]),
-                            html.Div(["🔴 ", html.Span(id="security-red-count")]),
-                            html.Div(["🟡 ", html.Span(id="security-yellow-count")]),
-                            html.Div(id="security-compliance"),
-                            html.Div(id="security-alerts"),
-                        ],
-                    ),
-                    html.Div(
-                        id="advanced-analytics-card",
-                        className="card",
-                        children=[
-                            html.H3("Advanced Analytics"),
-                            html.Div("Traffic Pattern", id="toggle-traffic-pattern", className="toggle-btn blue"),
-                            html.Div("Security Score", id="toggle-security-score", className="toggle-btn green"),
-                            html.Div("Usage Efficiency", id="toggle-usage-efficiency", className="toggle-btn yellow"),
-                            html.Div("Anomaly Detection", id="toggle-anomaly-detection", className="toggle-btn red"),
-                        ],
-                    ),
-                    html.Div(
-                        id="data-visualization-card",
-                        className="card",
-                        style={"flex": "1"},
-                        children=[
-                            html.H3("Data Visualization"),
-                            html.Label("Chart Type:", htmlFor="chart-type-dropdown"),
-                            dcc.Dropdown(
-                                id="chart-type-dropdown",
-                                options=[
-                                    {"label": "Hourly Activity", "value": "hourly"},
-                                    {"label": "Security Distribution", "value": "security"},
-                                    {"label": "Heatmap (Day vs Hour)", "value": "heatmap"},
-                                ],
-                                value="hourly",
-                                style={"width": "200px", "marginBottom": "10px"},
-                            ),
-                            dcc.Graph(id="main-chart", config={"displayModeBar": True}, style={"height": "400px"}),
-                        ],
-                    ),
-                    html.Div(
-                        id="export-reports-card",
-                        className="card",
-                        style={"minWidth": "200px"},
-                        children=[
-                            html.H3("Export & Reports"),
-                            html.Button("📊 Export Stats CSV", id="export-csv-btn", className="btn btn-light", style={"marginBottom": "10px", "width": "100%"}),
-                            html.Button("💾 Download Charts", id="download-charts-btn", className="btn btn-light", style={"marginBottom": "10px", "width": "100%"}),
-                            html.Button("Generate Report", id="generate-report-btn", className="btn btn-primary", style={"marginBottom": "10px", "width": "100%"}),
-                            html.Button("🔄 Refresh Data", id="refresh-data-btn", className="btn btn-light", style={"width": "100%"}),
-                        ],
-                    ),
-                ],
-            ),
+            _analytics_cards_row(),
 
+            # Memory stores: none of this outlives the uploaded file, so skip
+            # the synchronous sessionStorage write on every update
             dcc.Store(id="uploaded-file-store"),
-            dcc.Store(id="csv-headers-store", storage_type="session"),
-            dcc.Store(id="processed-data-store", storage_type="session"),
-            dcc.Store(id="enhanced-metrics-store", storage_type="session"),
+            dcc.Store(id="csv-headers-store"),
+            dcc.Store(id="enhanced-metrics-store"),
         ],
     )
 
 
 def register_callbacks(app_instance: Dash):
-    @app_instance.callback(
-        Output("tab-content", "children"),
-        [
-            Input("tab-overview", "n_clicks_timestamp"),
-            Input("tab-advanced", "n_clicks_timestamp"),
-            Input("tab-export", "n_clicks_timestamp"),
-        ],
-    )
-    def render_tab_content(ts_overview, ts_advanced, ts_export):
-        timestamps = {
-            "overview": ts_overview or 0,
-            "advanced": ts_advanced or 0,
-            "export": ts_export or 0,
-        }
-        active_tab = max(timestamps, key=lambda k: timestamps[k])
-        if active_tab == "overview":
-            return overview_layout()
-        elif active_tab == "advanced":
-            return advanced_layout()
-        else:
-            return export_layout()
-
-    @app_instance.callback(
+    # Panes are pre-rendered by create_tab_content, so this runs in the browser.
+    # The JS lives in assets/tab-switching.js where it is cached like any asset.
+    app_instance.clientside_callback(
+        ClientsideFunction(namespace="tabs", function_name="switchTab"),
         [
+            Output("overview-wrap", "style"),
+            Output("advanced-wrap", "style"),
+            Output("export-wrap", "style"),
             Output("tab-overview", "className"),
             Output("tab-advanced", "className"),
             Output("tab-export", "className"),
         ],
         [
-            Input("tab-overview", "n_clicks_timestamp"),
-            Input("tab-advanced", "n_clicks_timestamp"),
-            Input("tab-export", "n_clicks_timestamp"),
+            Input("tab-overview", "n_clicks"),
+            Input("tab-advanced", "n_clicks"),
+            Input("tab-export", "n_clicks"),
         ],
+        # The pre-rendered panes already start on Overview
+        prevent_initial_call=True,
     )
-    def update_tab_active(ts_overview, ts_advanced, ts_export):
-        timestamps = {
-            "overview": ts_overview or 0,
-            "advanced": ts_advanced or 0,
-            "export": ts_export or 0,
-        }
-        active = max(timestamps, key=lambda k: timestamps[k])
-        return [
-            "tab active" if active == "overview" else "tab",
-            "tab active" if active == "advanced" else "tab",
-            "tab active" if active == "export" else "tab",
-        ]
 
 
 if __name__ == "__main__":
+    # Standalone preview only; importing this module must not build an app.
+    # custom.css is picked up automatically from the project assets folder.
+    app = Dash(__name__, assets_folder=os.path.join(os.path.dirname(__file__), "..", "..", "assets"))
     app.layout = create_main_layout(app)
     register_callbacks(app)
+    from ui.components.graph import register_graph_callbacks
+    register_graph_callbacks(app)
     app.run_server(debug=True)
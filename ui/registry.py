@@ -2,12 +2,13 @@
 """
 Component registry to resolve circular dependencies
 """
+import sys
 from typing import Dict, Any, Optional, Callable
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ComponentConfig:
-    """Configuration for a component"""
+    """Configuration for a component. configure() replaces it; never mutated."""
     icons: Dict[str, str]
     theme: Dict[str, Any]
     settings: Dict[str, Any]
@@ -16,7 +17,7 @@ class ComponentRegistry:
     """Central registry for UI components"""
     
     def __init__(self):
-        self._components: Dict[str, Any] = {}
+        self._components: Dict[str, Callable[..., Any]] = {}
         self._config: Optional[ComponentConfig] = None
     
     def configure(self, icons: Dict[str, str], theme: Dict[str, Any], settings: Dict[str, Any]):
@@ -25,25 +26,22 @@ class ComponentRegistry:
     
     def register(self, name: str, component_class: type):
         """Register a component class"""
-        self._components[name] = component_class
+        # Bind the factory once; config is still read at creation time so
+        # components may be registered before configure() is called
+        def factory(**kwargs):
+            if self._config is None:
+                raise RuntimeError("Registry not configured")
+            return component_class(config=self._config, **kwargs)
+        
+        # Interned keys let create() calls with literal names match by identity
+        self._components[sys.intern(name)] = factory
     
     def create(self, name: str, **kwargs) -> Any:
         """Create a component instance"""
-        if name not in self._components:
+        factory = self._components.get(name)
+        if factory is None:
             raise ValueError(f"Component '{name}' not registered")
-        
-        if self._config is None:
-            raise RuntimeError("Registry not configured")
-        
-        component_class = self._components[name]
-        
-        # Inject configuration
-        if hasattr(component_class, '__init__'):
-            return component_class(
-                config=self._config,
-                **kwargs
-            )
-        return component_class(**kwargs)
+        return factory(**kwargs)
     
     def get_config(self) -> ComponentConfig:
         """Get current configuration"""
@@ -1,4 +1,4 @@
 from .style_config import *
 from .graph_styles import *
-from .helpers import get_card_style, get_button_style, get_input_style
+from .helpers import get_card_style, get_button_style, get_input_style, merged
 
@@ -5,7 +5,9 @@ Graph styling configuration for Cytoscape components
 
 from ui.themes.style_config import COLORS, SPACING, BORDER_RADIUS, SHADOWS, TYPOGRAPHY
 
-# Cytoscape graph styles
+# Cytoscape graph styles. Variants match on the element classes set by
+# prepare_cytoscape_elements (door, core, entrance, critical; access, security,
+# critical edges) rather than on data attributes.
 GRAPH_STYLES = [
     # Node styles
     {
@@ -28,7 +30,7 @@ GRAPH_STYLES = [
     
     # Core/Central nodes
     {
-        'selector': 'node[type = "core"]',
+        'selector': 'node.core',
         'style': {
             'background-color': COLORS['accent'],
             'border-color': COLORS['accent'],
@@ -42,7 +44,7 @@ GRAPH_STYLES = [
     
     # Entrance nodes
     {
-        'selector': 'node[type = "entrance"]',
+        'selector': 'node.entrance',
         'style': {
             'background-color': COLORS['success'],
             'border-color': COLORS['success'],
@@ -53,22 +55,9 @@ GRAPH_STYLES = [
         }
     },
     
-    # Security layer nodes
-    {
-        'selector': 'node[type = "security"]',
-        'style': {
-            'background-color': COLORS['warning'],
-            'border-color': COLORS['warning'],
-            'color': 'white',
-            'shape': 'diamond',
-            'width': 65,
-            'height': 65
-        }
-    },
-    
     # Critical asset nodes
     {
-        'selector': 'node[type = "critical"]',
+        'selector': 'node.critical',
         'style': {
             'background-color': COLORS['critical'],
             'border-color': COLORS['critical'],
@@ -80,6 +69,19 @@ GRAPH_STYLES = [
         }
     },
     
+    # Per-floor groups emitted when large graphs are coarsened
+    {
+        'selector': 'node.compound',
+        'style': {
+            'background-color': COLORS['accent'],
+            'background-opacity': 0.2,
+            'border-color': COLORS['accent'],
+            'border-width': 2,
+            'shape': 'round-rectangle',
+            'text-valign': 'top'
+        }
+    },
+    
     # Edge styles
     {
         'selector': 'edge',
@@ -87,7 +89,7 @@ GRAPH_STYLES = [
             'line-color': COLORS['border'],
             'target-arrow-color': COLORS['border'],
             'target-arrow-shape': 'triangle',
-            'curve-style': 'bezier',
+            'curve-style': 'bezier',  # haystack is cheaper but draws no arrows (see GRAPH_STYLES_LITE)
             'width': 2,
             'arrow-scale': 1.2
         }
@@ -95,7 +97,7 @@ GRAPH_STYLES = [
     
     # Access path edges
     {
-        'selector': 'edge[type = "access"]',
+        'selector': 'edge.access',
         'style': {
             'line-color': COLORS['success'],
             'target-arrow-color': COLORS['success'],
@@ -105,7 +107,7 @@ GRAPH_STYLES = [
     
     # Security boundary edges
     {
-        'selector': 'edge[type = "security"]',
+        'selector': 'edge.security',
         'style': {
             'line-color': COLORS['warning'],
             'target-arrow-color': COLORS['warning'],
@@ -116,7 +118,7 @@ GRAPH_STYLES = [
     
     # Critical path edges
     {
-        'selector': 'edge[type = "critical"]',
+        'selector': 'edge.critical',
         'style': {
             'line-color': COLORS['critical'],
             'target-arrow-color': COLORS['critical'],
@@ -143,26 +145,42 @@ GRAPH_STYLES = [
             'target-arrow-color': COLORS['accent'],
             'z-index': 999
         }
-    },
-    
-    # Selected states
+    }
+    # No :selected rules: the graph is built with autounselectify, so nothing is ever selected
+]
+
+# Stripped-down stylesheet for very large facilities: no labels, no arrows.
+# Text and arrowhead drawing dominate canvas frame time once edges run into
+# the thousands.
+GRAPH_STYLES_LITE = [
     {
-        'selector': 'node:selected',
+        'selector': 'node',
         'style': {
-            'border-width': 5,
-            'border-color': COLORS['accent'],
-            'box-shadow': '0 0 20px rgba(33, 150, 243, 0.4)',  # Fixed: use rgba instead of hex+alpha
-            'z-index': 1000
+            'background-color': COLORS['surface'],
+            'border-color': COLORS['border'],
+            'border-width': 1,
+            'width': 20,
+            'height': 20
         }
     },
-    
     {
-        'selector': 'edge:selected',
+        'selector': 'node.entrance',
+        'style': {'background-color': COLORS['success']}
+    },
+    {
+        'selector': 'node.critical',
+        'style': {'background-color': COLORS['critical']}
+    },
+    {
+        'selector': 'node.compound',
+        'style': {'background-opacity': 0.2, 'border-width': 2}
+    },
+    {
+        'selector': 'edge',
         'style': {
-            'width': 5,
-            'line-color': COLORS['accent'],
-            'target-arrow-color': COLORS['accent'],
-            'z-index': 1000
+            'line-color': COLORS['border'],
+            'curve-style': 'haystack',  # Cheapest edge renderer in cytoscape.js; no arrowheads
+            'width': 1
         }
     }
 ]
@@ -367,6 +385,7 @@ graph_loading_style = {
 # Export all styles
 __all__ = [
     'GRAPH_STYLES',
+    'GRAPH_STYLES_LITE',
     'GRAPH_CONTAINER_STYLE', 
     'LAYOUT_OPTIONS',
     'LEGEND_STYLE',
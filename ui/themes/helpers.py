@@ -1,46 +1,83 @@
-from .style_config import COMPONENT_STYLES, COLORS, SPACING, BORDER_RADIUS, SHADOWS, ANIMATIONS, TYPOGRAPHY
+import re
+from functools import lru_cache
+
+from .style_config import COMPONENT_STYLES, build_component_styles, COLORS, SPACING, BORDER_RADIUS, SHADOWS, ANIMATIONS, TYPOGRAPHY
+
+
+_KEBAB_RE = re.compile(r'-([a-z])')
+
+
+def _camel_repl(match):
+    return match.group(1).upper()
 
 
 def _convert_keys(style_dict):
     """Convert kebab-case keys to camelCase for Dash."""
-    converted = {}
-    for key, value in style_dict.items():
-        if '-' in key:
-            parts = key.split('-')
-            camel = parts[0] + ''.join(p.title() for p in parts[1:])
-            converted[camel] = value
-        else:
-            converted[key] = value
-    return converted
+    return {
+        (_KEBAB_RE.sub(_camel_repl, key) if '-' in key else key): value
+        for key, value in style_dict.items()
+    }
+
+
+def merged(*styles):
+    """Combine style dicts left to right into a single new dict."""
+    result = {}
+    for style in styles:
+        result.update(style)
+    return result
+
+
+# COMPONENT_STYLES never changes at runtime, so convert every entry once
+_COMPONENT_STYLES_CAMEL = {name: _convert_keys(style) for name, style in COMPONENT_STYLES.items()}
+
+# (factory, id(theme)) -> (theme, styles)
+_theme_style_cache = {}
+
+
+def memoized_styles(factory, theme):
+    """Return factory(theme), computed once per factory and theme object."""
+    key = (factory, id(theme))
+    entry = _theme_style_cache.get(key)
+    # The entry keeps the theme alive, so its id cannot be reused while cached
+    if entry is None or entry[0] is not theme:
+        entry = (theme, factory(theme))
+        _theme_style_cache[key] = entry
+    return entry[1]
+
+
+def _camel_component_styles(theme):
+    return {name: _convert_keys(style) for name, style in build_component_styles(theme).items()}
 
 
-def get_component_style(name):
-    """Return component style from CONFIG with camelCase keys."""
-    style = COMPONENT_STYLES.get(name, {}).copy()
-    return _convert_keys(style)
+def get_component_style(name, theme=None):
+    """Return component style with camelCase keys, optionally for another colour palette. Shared; do not mutate."""
+    styles = _COMPONENT_STYLES_CAMEL if theme is None else memoized_styles(_camel_component_styles, theme)
+    style = styles.get(name)
+    return {} if style is None else style
 
 
+@lru_cache(maxsize=None)
 def get_card_style(elevated=False):
-    """Return standard card style."""
+    """Return standard card style. Shared; do not mutate."""
     key = 'card_elevated' if elevated else 'card'
     return get_component_style(key)
 
 
+@lru_cache(maxsize=None)
 def get_button_style(variant='primary'):
-    """Return standardized button style."""
+    """Return standardized button style. Shared; do not mutate."""
     return get_component_style(f'button_{variant}')
 
 
+@lru_cache(maxsize=None)
 def get_input_style():
-    """Return standardized input style."""
+    """Return standardized input style. Shared; do not mutate."""
     return get_component_style('input')
 
 
 def get_card_container_style(padding=SPACING['lg'], margin_bottom=SPACING['md'], elevated=False):
     """Return card style with common padding and margin."""
-    style = get_card_style(elevated)
-    style.update({'padding': padding, 'marginBottom': margin_bottom})
-    return style
+    return {**get_card_style(elevated), 'padding': padding, 'marginBottom': margin_bottom}
 
 
 def get_section_header_style(font_size=TYPOGRAPHY['text_xl'], margin_bottom=SPACING['base']):
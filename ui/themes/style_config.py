@@ -3,6 +3,10 @@
 Comprehensive style configuration with consistent background colors
 """
 
+import os
+from functools import lru_cache
+from types import MappingProxyType
+
 # Color palette - UPDATED for consistency
 COLORS = {
     # Primary colors
@@ -93,64 +97,75 @@ SHADOWS = {
     'outline': '0 0 0 3px rgba(33, 150, 243, 0.5)'  # Focus outline
 }
 
-# Component styles - UPDATED with new color scheme
-COMPONENT_STYLES = {
-    'card': {
-        'background-color': COLORS['surface'],
-        'border': f"1px solid {COLORS['border']}",
-        'border-radius': BORDER_RADIUS['xl'],
-        'box-shadow': SHADOWS['lg'],
-        'padding': SPACING['xl']
-    },
-    'card_elevated': {
-        'background-color': COLORS['surface_elevated'],
-        'border': f"1px solid {COLORS['border']}",
-        'border-radius': BORDER_RADIUS['xl'],
-        'box-shadow': SHADOWS['xl'],
-        'padding': SPACING['xl']
-    },
-    'button_primary': {
-        'background-color': COLORS['accent'],
-        'color': COLORS['text_on_accent'],
-        'border': 'none',
-        'padding': f"{SPACING['sm']} {SPACING['lg']}",
-        'border-radius': BORDER_RADIUS['lg'],
-        'font-weight': TYPOGRAPHY['font_semibold'],
-        'cursor': 'pointer',
-        'transition': f'all {ANIMATIONS["fast"]}',
-        'box-shadow': SHADOWS['md']
-    },
-    'button_secondary': {
-        'background-color': 'transparent',
-        'color': COLORS['text_secondary'],
-        'border': f"1px solid {COLORS['border']}",
-        'padding': f"{SPACING['sm']} {SPACING['lg']}",
-        'border-radius': BORDER_RADIUS['lg'],
-        'font-weight': TYPOGRAPHY['font_medium'],
-        'cursor': 'pointer',
-        'transition': f'all {ANIMATIONS["fast"]}'
-    },
-    'button_success': {
-        'background-color': COLORS['success'],
-        'color': COLORS['text_on_accent'],
-        'border': 'none',
-        'padding': f"{SPACING['sm']} {SPACING['lg']}",
-        'border-radius': BORDER_RADIUS['lg'],
-        'font-weight': TYPOGRAPHY['font_semibold'],
-        'cursor': 'pointer',
-        'transition': f'all {ANIMATIONS["fast"]}',
-        'box-shadow': SHADOWS['md']
-    },
-    'input': {
-        'background-color': COLORS['surface'],
-        'border': f"1px solid {COLORS['border']}",
-        'border-radius': BORDER_RADIUS['md'],
-        'padding': SPACING['sm'],
-        'color': COLORS['text_primary'],
-        'font-size': TYPOGRAPHY['text_base'],
-        'transition': f'border-color {ANIMATIONS["fast"]}'
+# Composite values shared by several component styles, formatted once
+_PADDING_SM_LG = f"{SPACING['sm']} {SPACING['lg']}"
+_TRANSITION_FAST = f'all {ANIMATIONS["fast"]}'
+
+
+def build_component_styles(colors):
+    """Build the kebab-case component style table for a colour palette."""
+    border_1px = f"1px solid {colors['border']}"
+    return {
+        'card': {
+            'background-color': colors['surface'],
+            'border': border_1px,
+            'border-radius': BORDER_RADIUS['xl'],
+            'box-shadow': SHADOWS['lg'],
+            'padding': SPACING['xl']
+        },
+        'card_elevated': {
+            'background-color': colors['surface_elevated'],
+            'border': border_1px,
+            'border-radius': BORDER_RADIUS['xl'],
+            'box-shadow': SHADOWS['xl'],
+            'padding': SPACING['xl']
+        },
+        'button_primary': {
+            'background-color': colors['accent'],
+            'color': colors['text_on_accent'],
+            'border': 'none',
+            'padding': _PADDING_SM_LG,
+            'border-radius': BORDER_RADIUS['lg'],
+            'font-weight': TYPOGRAPHY['font_semibold'],
+            'cursor': 'pointer',
+            'transition': _TRANSITION_FAST,
+            'box-shadow': SHADOWS['md']
+        },
+        'button_secondary': {
+            'background-color': 'transparent',
+            'color': colors['text_secondary'],
+            'border': border_1px,
+            'padding': _PADDING_SM_LG,
+            'border-radius': BORDER_RADIUS['lg'],
+            'font-weight': TYPOGRAPHY['font_medium'],
+            'cursor': 'pointer',
+            'transition': _TRANSITION_FAST
+        },
+        'button_success': {
+            'background-color': colors['success'],
+            'color': colors['text_on_accent'],
+            'border': 'none',
+            'padding': _PADDING_SM_LG,
+            'border-radius': BORDER_RADIUS['lg'],
+            'font-weight': TYPOGRAPHY['font_semibold'],
+            'cursor': 'pointer',
+            'transition': _TRANSITION_FAST,
+            'box-shadow': SHADOWS['md']
+        },
+        'input': {
+            'background-color': colors['surface'],
+            'border': border_1px,
+            'border-radius': BORDER_RADIUS['md'],
+            'padding': SPACING['sm'],
+            'color': colors['text_primary'],
+            'font-size': TYPOGRAPHY['text_base'],
+            'transition': f'border-color {ANIMATIONS["fast"]}'
+        }
     }
-}
+
+
+# Component styles - UPDATED with new color scheme
+COMPONENT_STYLES = build_component_styles(COLORS)
 
 # UI visibility settings - UPDATED with consistent background
 UI_VISIBILITY = {
@@ -387,113 +402,91 @@ CLASSIFICATION_STYLES = {
     }
 }
 
+# Base upload style merged with each state's overrides, built once
+_UPLOAD_STYLE_BY_STATE = {
+    state: {**UPLOAD_STYLES['base'], **overrides}
+    for state, overrides in UPLOAD_STYLES['states'].items()
+}
+
+
 def get_upload_style(state="initial"):
-    """Return upload container style for a given state."""
-    return {**UPLOAD_STYLES['base'], **UPLOAD_STYLES['states'].get(state, {})}
+    """Return upload container style for a given state. Shared; do not mutate."""
+    style = _UPLOAD_STYLE_BY_STATE.get(state)
+    # Unknown states fall back to the bare base style, as before
+    return UPLOAD_STYLES['base'] if style is None else style
 
 
+@lru_cache(maxsize=None)
 def get_interactive_setup_style(visible=False):
-    """Style for the interactive setup container."""
+    """Style for the interactive setup container. Shared; do not mutate."""
     style = UPLOAD_STYLES['interactive_container'].copy()
     style['display'] = 'block' if visible else 'none'
     return style
 
 
-def get_validation_message_style(status="info"):
-    """Return mapping validation message style."""
-    color_map = {
-        'info': COLORS['text_secondary'],
-        'warning': COLORS['warning'],
-        'error': COLORS['critical'],
-        'success': COLORS['success']
-    }
-    return {
+# One finished style per validation status
+_VALIDATION_STYLES = {
+    status: {
         'marginTop': '8px',
         'padding': '8px',
         'borderRadius': '4px',
-        'backgroundColor': f"{color_map[status]}20",
-        'border': f"1px solid {color_map[status]}",
-        'color': color_map[status],
+        'backgroundColor': f"{color}20",
+        'border': f"1px solid {color}",
+        'color': color,
         'fontSize': '0.85rem',
         'textAlign': 'center'
     }
-
-# CSS Animations (can be added to CSS file)
-CSS_ANIMATIONS = """
-@keyframes fadeIn {
-    from { opacity: 0; transform: translateY(10px); }
-    to { opacity: 1; transform: translateY(0); }
+    for status, color in (
+        ('info', COLORS['text_secondary']),
+        ('warning', COLORS['warning']),
+        ('error', COLORS['critical']),
+        ('success', COLORS['success'])
+    )
 }
 
-@keyframes slideUp {
-    from { opacity: 0; transform: translateY(20px); }
-    to { opacity: 1; transform: translateY(0); }
-}
 
-@keyframes slideDown {
-    from { opacity: 0; transform: translateY(-10px); }
-    to { opacity: 1; transform: translateY(0); }
-}
+def get_validation_message_style(status="info"):
+    """Return mapping validation message style. Shared; do not mutate."""
+    return _VALIDATION_STYLES[status]
 
-@keyframes pulse {
-    0%, 100% { opacity: 1; }
-    50% { opacity: 0.5; }
-}
+# CSS Animations live in assets/animations.css, which Dash serves directly.
+# CSS_ANIMATIONS is still available as a module attribute, read on first use.
+_CSS_ANIMATIONS_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'assets', 'animations.css')
 
-@keyframes spin {
-    from { transform: rotate(0deg); }
-    to { transform: rotate(360deg); }
-}
 
-.hover-lift {
-    transition: transform 0.2s ease, box-shadow 0.2s ease;
-}
+@lru_cache(maxsize=None)
+def _load_css_animations():
+    with open(_CSS_ANIMATIONS_PATH, encoding='utf-8') as f:
+        return f.read()
 
-.hover-lift:hover {
-    transform: translateY(-2px);
-    box-shadow: 0 10px 25px rgba(0, 0, 0, 0.15);
-}
 
-.loading-shimmer {
-    background: linear-gradient(90deg, 
-        transparent, 
-        rgba(33, 150, 243, 0.4), 
-        transparent
-    );
-    animation: shimmer 1.5s infinite;
-}
+def __getattr__(name):
+    if name == 'CSS_ANIMATIONS':
+        return _load_css_animations()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-@keyframes shimmer {
-    0% { transform: translateX(-100%); }
-    100% { transform: translateX(100%); }
-}
-"""
 
 # Utility Functions
 def get_hover_style(base_style, hover_color=None):
     """Generate hover styles for interactive elements"""
-    hover_style = base_style.copy()
     if hover_color:
-        hover_style["backgroundColor"] = hover_color
-    else:
-        hover_style["opacity"] = "0.8"
-    hover_style["transform"] = "translateY(-1px)"
-    return hover_style
+        return {**base_style, "backgroundColor": hover_color, "transform": "translateY(-1px)"}
+    return {**base_style, "opacity": "0.8", "transform": "translateY(-1px)"}
 
 def get_focus_style(base_style):
     """Generate focus styles for form elements"""
-    focus_style = base_style.copy()
-    focus_style["borderColor"] = COLORS["accent"]
-    focus_style["boxShadow"] = SHADOWS["outline"]
-    return focus_style
+    return {**base_style, "borderColor": COLORS["accent"], "boxShadow": SHADOWS["outline"]}
 
 def get_disabled_style(base_style):
     """Generate disabled styles for elements"""
-    disabled_style = base_style.copy()
-    disabled_style["opacity"] = "0.5"
-    disabled_style["cursor"] = "not-allowed"
-    disabled_style["pointerEvents"] = "none"
-    return disabled_style
+    return {**base_style, "opacity": "0.5", "cursor": "not-allowed", "pointerEvents": "none"}
+
+# Freeze the design tokens so no component can restyle the whole app by
+# mutating them. Only individual values (strings) ever reach Dash props.
+COLORS = MappingProxyType(COLORS)
+TYPOGRAPHY = MappingProxyType(TYPOGRAPHY)
+SPACING = MappingProxyType(SPACING)
+SHADOWS = MappingProxyType(SHADOWS)
 
 # Export all configurations
 __all__ = [
@@ -504,13 +497,13 @@ __all__ = [
     'BORDER_RADIUS',
     'SHADOWS',
     'COMPONENT_STYLES',
+    'build_component_styles',
     'UPLOAD_STYLES',
     'MAPPING_STYLES',
     'CLASSIFICATION_STYLES',
     'UI_VISIBILITY',
     'UI_COMPONENTS',
     'LAYOUT_CONFIG',
-    'CSS_ANIMATIONS',
     'get_upload_style',
     'get_interactive_setup_style',
     'get_validation_message_style',
@@ -8,19 +8,88 @@ import pandas as pd
 import numpy as np
 import json
 import base64
+import copy
+import functools
 import io
+import os
+import tempfile
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Any, Optional, Union
+from typing import Dict, Iterable, List, Tuple, Any, Optional, Union
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 
-from config.settings.py import REQUIRED_INTERNAL_COLUMNS
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib json encoder
+    orjson = None
+
+from config.settings import REQUIRED_INTERNAL_COLUMNS
 from ui.themes.style_config import COLORS
 from utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+_DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+_NAT_DAY = np.iinfo(np.int64).min  # datetime64[D] view of NaT
+_TREND_INCREASING, _TREND_DECREASING, _TREND_STABLE = "📈 Increasing", "📉 Decreasing", "📊 Stable"
+
+
+def _day_numbers(timestamps: pd.Series) -> np.ndarray:
+    """Calendar day of each timestamp as int64 days since the epoch (_NAT_DAY for missing)"""
+    if timestamps.dt.tz is not None:
+        timestamps = timestamps.dt.tz_localize(None)
+    return timestamps.to_numpy(dtype='datetime64[ns]').astype('datetime64[D]').view(np.int64)
+
+
+@dataclass(frozen=True)
+class _EventColumns:
+    """Struct-of-arrays view of an event log, decoded once per frame"""
+    hours: Optional[np.ndarray] = None        # int8 hour of day, -1 where the timestamp is missing
+    days: Optional[np.ndarray] = None         # int64 days since the epoch, _NAT_DAY where missing
+    user_codes: Optional[np.ndarray] = None   # intp codes into `users`, -1 for missing IDs
+    users: Optional[pd.Index] = None
+    door_codes: Optional[np.ndarray] = None
+    doors: Optional[pd.Index] = None
+    event_codes: Optional[np.ndarray] = None
+    event_types: Optional[pd.Index] = None
+
+
+_FRAME_MEMO_SIZE = 4  # event frames (and their categorical copies) remembered per processor
+_FINGERPRINT_SAMPLE_ROWS = 64  # evenly spaced rows hashed into each frame fingerprint
+
+
+def _memoize_per_frame(method):
+    """Cache a processor method's result per event frame until the frame's fingerprint changes
+    
+    Only for methods whose result depends on the frame and arguments alone, never on
+    the clock. Dict results are deep-copied on the way out so callers cannot edit the
+    cached copy; other results (frames, arrays) are shared and must be treated as read-only.
+    """
+    @functools.wraps(method)
+    def wrapper(self, df, *args, **kwargs):
+        if not isinstance(df, pd.DataFrame) or df.empty:
+            return method(self, df, *args, **kwargs)
+        
+        fingerprint = self._frame_fingerprint(df)
+        entry = self._frame_memo.get(id(df))
+        if entry is None or entry[0] is not df or entry[1] != fingerprint:
+            if id(df) not in self._frame_memo and len(self._frame_memo) >= _FRAME_MEMO_SIZE:
+                self._frame_memo.pop(next(iter(self._frame_memo)))
+            entry = self._frame_memo[id(df)] = (df, fingerprint, {})
+        
+        # Extra arguments (e.g. device_attrs) are matched by identity; refs are kept so ids stay unique
+        refs = args + tuple(kwargs[k] for k in sorted(kwargs))
+        key = (method.__name__, tuple(sorted(kwargs))) + tuple(id(ref) for ref in refs)
+        hit = entry[2].get(key)
+        if hit is None or any(a is not b for a, b in zip(hit[0], refs)):
+            hit = entry[2][key] = (refs, method(self, df, *args, **kwargs))
+        
+        result = hit[1]
+        return copy.deepcopy(result) if isinstance(result, dict) else result
+    return wrapper
+
 
 class EnhancedDataProcessor:
     """Enhanced data processing for comprehensive analytics"""
@@ -30,30 +99,45 @@ class EnhancedDataProcessor:
         self.doorid_col = REQUIRED_INTERNAL_COLUMNS['DoorID']
         self.userid_col = REQUIRED_INTERNAL_COLUMNS['UserID']
         self.eventtype_col = REQUIRED_INTERNAL_COLUMNS['EventType']
+        # Last (device_attrs, row count, SecurityLevel counts), shared by the device and security reports
+        self._security_counts = None
+        # id(frame) -> (frame, fingerprint, {call key: result}), see _memoize_per_frame
+        self._frame_memo = {}
         
+    @_memoize_per_frame
     def process_temporal_patterns(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Analyze temporal access patterns"""
         if df is None or df.empty or self.timestamp_col not in df.columns:
             return self._get_default_temporal_patterns()
         
         patterns = {}
-        
-        # Hourly patterns
-        hourly_counts = df.groupby(df[self.timestamp_col].dt.hour).size()
+        # Built from the categorical copy so all reports share one memoized view
+        columns = self._build_event_columns(self._ensure_categorical(df))
+
+        # Hourly patterns (only hours that saw events, as a groupby would give)
+        hour_bins = np.bincount(columns.hours[columns.hours >= 0], minlength=24)
+        active_hours = np.flatnonzero(hour_bins)
+        hourly_counts = pd.Series(hour_bins[active_hours], index=active_hours)
         patterns['hourly_distribution'] = hourly_counts.to_dict()
         patterns['peak_hour'] = hourly_counts.idxmax()
         patterns['peak_hour_count'] = hourly_counts.max()
         patterns['lowest_hour'] = hourly_counts.idxmin()
         patterns['lowest_hour_count'] = hourly_counts.min()
         
-        # Daily patterns
-        daily_counts = df.groupby(df[self.timestamp_col].dt.day_name()).size()
+        # Integer day keys: per-day counts without building a date object per row
+        days = columns.days[columns.days != _NAT_DAY]
+        
+        # Daily patterns (the epoch fell on a Thursday); names sorted as a groupby would
+        weekday_bins = np.bincount((days + 3) % 7, minlength=7)
+        daily_counts = pd.Series(
+            {_DAY_NAMES[d]: weekday_bins[d] for d in np.flatnonzero(weekday_bins)}, dtype=np.int64
+        ).sort_index()
         patterns['daily_distribution'] = daily_counts.to_dict()
         patterns['busiest_day'] = daily_counts.idxmax()
         patterns['busiest_day_count'] = daily_counts.max()
         
         # Weekly patterns
-        weekly_counts = df.groupby(df[self.timestamp_col].dt.date).size()
+        weekly_counts = pd.Series(np.unique(days, return_counts=True)[1])
         patterns['daily_average'] = weekly_counts.mean()
         patterns['daily_variance'] = weekly_counts.var()
         patterns['trend_slope'] = self._calculate_trend_slope(weekly_counts)
@@ -64,18 +148,24 @@ class EnhancedDataProcessor:
         
         return patterns
     
+    @_memoize_per_frame
     def process_user_behavior(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Analyze user behavior patterns"""
         if df is None or df.empty or self.userid_col not in df.columns:
             return self._get_default_user_behavior()
         
+        # value_counts breaks ties in category order only for columns that came in categorical
+        category_ties = isinstance(df[self.userid_col].dtype, pd.CategoricalDtype)
+        df = self._ensure_categorical(df)
         behavior = {}
         
-        # User activity metrics
-        user_counts = df[self.userid_col].value_counts()
+        # User activity metrics (unsorted counts: only the top entry is read)
+        columns = self._build_event_columns(df)
+        user_counts = self._count_codes(columns.user_codes, columns.users)
+        top_user = self._top_position(user_counts, category_ties) if len(user_counts) > 0 else None
         behavior['total_unique_users'] = len(user_counts)
-        behavior['most_active_user'] = user_counts.index[0] if len(user_counts) > 0 else 'N/A'
-        behavior['most_active_user_count'] = user_counts.iloc[0] if len(user_counts) > 0 else 0
+        behavior['most_active_user'] = user_counts.index[top_user] if top_user is not None else 'N/A'
+        behavior['most_active_user_count'] = user_counts.iloc[top_user] if top_user is not None else 0
         behavior['average_events_per_user'] = user_counts.mean()
         behavior['user_activity_variance'] = user_counts.var()
         
@@ -94,26 +184,31 @@ class EnhancedDataProcessor:
         
         return behavior
     
+    # Not memoized: "active today" and the weekly trends move with the clock
     def process_device_analytics(self, df: pd.DataFrame, device_attrs: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
         """Analyze device usage and performance"""
         if df is None or df.empty or self.doorid_col not in df.columns:
             return self._get_default_device_analytics()
         
+        category_ties = isinstance(df[self.doorid_col].dtype, pd.CategoricalDtype)
+        df = self._ensure_categorical(df)
         analytics = {}
         
         # Device usage metrics
-        device_counts = df[self.doorid_col].value_counts()
+        columns = self._build_event_columns(df)
+        device_counts = self._count_codes(columns.door_codes, columns.doors)
+        top_device = self._top_position(device_counts, category_ties) if len(device_counts) > 0 else None
         analytics['total_devices'] = len(device_counts)
-        analytics['most_active_device'] = device_counts.index[0] if len(device_counts) > 0 else 'N/A'
-        analytics['most_active_device_count'] = device_counts.iloc[0] if len(device_counts) > 0 else 0
+        analytics['most_active_device'] = device_counts.index[top_device] if top_device is not None else 'N/A'
+        analytics['most_active_device_count'] = device_counts.iloc[top_device] if top_device is not None else 0
         analytics['average_events_per_device'] = device_counts.mean()
         analytics['device_usage_variance'] = device_counts.var()
         
         # Device performance metrics
         if self.timestamp_col in df.columns:
             # Devices active today
-            today = datetime.now().date()
-            today_data = df[df[self.timestamp_col].dt.date == today]
+            today = pd.Timestamp(datetime.now().date())
+            today_data = self._slice_time_range(df, today, today + pd.Timedelta(days=1))
             analytics['devices_active_today'] = today_data[self.doorid_col].nunique() if not today_data.empty else 0
             
             # Device activity trends
@@ -133,8 +228,8 @@ class EnhancedDataProcessor:
         
         if device_attrs is not None and not device_attrs.empty:
             # Security level distribution
-            if 'SecurityLevel' in device_attrs.columns:
-                security_counts = device_attrs['SecurityLevel'].value_counts()
+            security_counts = self._security_level_counts(device_attrs)
+            if security_counts is not None:
                 total_devices = len(device_attrs)
                 
                 security['distribution'] = security_counts.to_dict()
@@ -144,22 +239,111 @@ class EnhancedDataProcessor:
             
             # Access control effectiveness
             if df is not None and not df.empty:
+                df = self._ensure_categorical(df)
                 effectiveness = self._analyze_access_control_effectiveness(df, device_attrs)
                 security['access_control_metrics'] = effectiveness
         
         return security
     
+    @_memoize_per_frame
+    def _ensure_categorical(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Cast the ID and event type columns to category so counts and groupbys hash integer codes
+        
+        The returned frame is memoized and shared by every report built from `df`
+        (it may be `df` itself), so callers must not modify it in place.
+        """
+        object_cols = [
+            col for col in (self.doorid_col, self.userid_col, self.eventtype_col)
+            if col in df.columns and (df[col].dtype == object or isinstance(df[col].dtype, pd.StringDtype))
+        ]
+        if not object_cols:
+            return df
+        return df.assign(**{col: df[col].astype('category') for col in object_cols})
+    
+    @_memoize_per_frame
+    def _build_event_columns(self, df: pd.DataFrame) -> _EventColumns:
+        """Decode the timestamp and ID columns into flat integer arrays"""
+        fields = {}
+        if self.timestamp_col in df.columns:
+            fields['hours'] = df[self.timestamp_col].dt.hour.fillna(-1).to_numpy(dtype=np.int8)
+            fields['days'] = _day_numbers(df[self.timestamp_col])
+        for col, codes_field, labels_field in (
+            (self.userid_col, 'user_codes', 'users'),
+            (self.doorid_col, 'door_codes', 'doors'),
+            (self.eventtype_col, 'event_codes', 'event_types'),
+        ):
+            if col in df.columns:
+                codes, uniques = pd.factorize(df[col])
+                fields[codes_field] = codes
+                fields[labels_field] = pd.Index(uniques)
+        return _EventColumns(**fields)
+    
+    def _count_codes(self, codes: np.ndarray, labels: pd.Index) -> pd.Series:
+        """Events per label, in first-seen order, from factorized codes"""
+        return pd.Series(np.bincount(codes[codes >= 0], minlength=len(labels)), index=labels)
+    
+    def _top_position(self, counts: pd.Series, category_ties: bool = False) -> int:
+        """Position of the largest count, ties broken as value_counts orders them
+        
+        Counts from _count_codes are in first-seen order, which is value_counts' tie
+        order for plain columns. Pass category_ties when the caller's column was already
+        categorical: value_counts then ties in category order. (Columns cast by
+        _ensure_categorical keep first-seen order, as value_counts saw them as objects.)
+        """
+        values = counts.to_numpy()
+        tied = np.flatnonzero(values == values.max())
+        if len(tied) > 1 and category_ties:
+            return int(tied[np.argmin(counts.index.codes[tied])])
+        return int(tied[0])
+    
+    def _frame_fingerprint(self, df: pd.DataFrame) -> Tuple[Any, ...]:
+        """Cheap identity check for a frame: shape, columns and a hash of evenly spaced rows
+        
+        The sample always includes the first and last rows. An in-place edit to a row
+        outside the sample is not detected; pass a new frame after editing instead.
+        """
+        fingerprint = (df.shape, tuple(df.columns))
+        sample = np.unique(np.linspace(0, len(df) - 1, num=min(len(df), _FINGERPRINT_SAMPLE_ROWS), dtype=np.int64))
+        try:
+            row_hashes = pd.util.hash_pandas_object(df.iloc[sample], index=False).to_numpy()
+        except TypeError:
+            # Unhashable cells (lists, dicts): fall back to their text form
+            row_hashes = tuple(df.iloc[sample].astype(str).itertuples(index=False, name=None))
+        else:
+            row_hashes = row_hashes.tobytes()
+        return fingerprint + (row_hashes,)
+    
+    def _slice_time_range(self, df: pd.DataFrame, start: pd.Timestamp,
+                          end: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+        """Rows with start <= timestamp < end; binary search when the log is time-ordered"""
+        timestamps = df[self.timestamp_col]
+        if timestamps.dt.tz is not None:
+            start = start.tz_localize(timestamps.dt.tz)
+            end = end.tz_localize(timestamps.dt.tz) if end is not None else None
+        
+        if timestamps.is_monotonic_increasing:
+            lo = timestamps.searchsorted(start, side='left')
+            hi = timestamps.searchsorted(end, side='left') if end is not None else len(df)
+            return df.iloc[lo:hi]
+        
+        in_range = timestamps >= start
+        if end is not None:
+            in_range &= timestamps < end
+        return df[in_range]
+    
     def _calculate_trend_slope(self, time_series: pd.Series) -> float:
         """Calculate trend slope for time series data"""
         if len(time_series) < 2:
             return 0.0
         
-        x = np.arange(len(time_series))
-        y = time_series.values
-        
-        # Simple linear regression
-        n = len(x)
-        slope = (n * np.sum(x * y) - np.sum(x) * np.sum(y)) / (n * np.sum(x**2) - (np.sum(x))**2)
+        y = np.asarray(time_series, dtype=np.float64)
+        n = len(y)
+
+        # Simple linear regression against x = 0..n-1, using closed forms for sum(x), sum(x^2)
+        sx = n * (n - 1) / 2
+        sxx = n * (n - 1) * (2 * n - 1) / 6
+        sxy = np.dot(np.arange(n, dtype=np.float64), y)
+        slope = (n * sxy - sx * y.sum()) / (n * sxx - sx * sx)
         return slope
     
     def _calculate_activity_intensity(self, hourly_counts: pd.Series) -> str:
@@ -176,129 +360,158 @@ class EnhancedDataProcessor:
     def _identify_rush_hours(self, hourly_counts: pd.Series) -> List[Tuple[int, int]]:
         """Identify rush hour periods"""
         threshold = hourly_counts.mean() + hourly_counts.std()
-        rush_hours = hourly_counts[hourly_counts > threshold]
-        
-        # Group consecutive hours
-        periods = []
-        current_start = None
-        
-        for hour in sorted(rush_hours.index):
-            if current_start is None:
-                current_start = hour
-                current_end = hour
-            elif hour == current_end + 1:
-                current_end = hour
-            else:
-                periods.append((current_start, current_end))
-                current_start = hour
-                current_end = hour
+        rush_hours = np.sort(hourly_counts.index[hourly_counts.to_numpy() > threshold].to_numpy())
+        
+        if rush_hours.size == 0:
+            return []
         
-        if current_start is not None:
-            periods.append((current_start, current_end))
+        # Group consecutive hours: a run ends wherever the next hour is not +1
+        run_breaks = np.diff(rush_hours) != 1
+        starts = rush_hours[np.r_[True, run_breaks]]
+        ends = rush_hours[np.r_[run_breaks, True]]
         
-        return periods
+        return list(zip(starts.tolist(), ends.tolist()))
     
     def _analyze_user_sessions(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Analyze user session patterns"""
-        sessions = []
-        
-        for user_id in df[self.userid_col].unique():
-            user_data = df[df[self.userid_col] == user_id].sort_values(self.timestamp_col)
-            
-            # Define session breaks (gaps > 30 minutes)
-            time_diffs = user_data[self.timestamp_col].diff()
-            session_breaks = time_diffs > timedelta(minutes=30)
-            
-            session_groups = session_breaks.cumsum()
-            
-            for session_id, session_data in user_data.groupby(session_groups):
-                session_length = (session_data[self.timestamp_col].max() - 
-                                session_data[self.timestamp_col].min()).total_seconds() / 60
-                sessions.append({
-                    'user_id': user_id,
-                    'length_minutes': session_length,
-                    'event_count': len(session_data)
-                })
-        
-        if sessions:
-            sessions_df = pd.DataFrame(sessions)
-            return {
-                'avg_length': sessions_df['length_minutes'].mean(),
-                'total_count': len(sessions),
-                'avg_per_user': len(sessions) / df[self.userid_col].nunique()
-            }
-        else:
+        events = df[[self.userid_col, self.timestamp_col]].dropna(subset=[self.userid_col])
+        events = events.sort_values([self.userid_col, self.timestamp_col])
+        if events.empty:
             return {'avg_length': 0, 'total_count': 0, 'avg_per_user': 0}
+
+        # A session starts at each user's first event and after any gap > 30 minutes
+        new_user = events[self.userid_col].ne(events[self.userid_col].shift())
+        session_breaks = new_user | (events[self.timestamp_col].diff() > timedelta(minutes=30))
+        session_ids = session_breaks.cumsum()
+
+        bounds = events.groupby(session_ids)[self.timestamp_col].agg(['min', 'max'])
+        length_minutes = (bounds['max'] - bounds['min']).dt.total_seconds() / 60
+        total_sessions = len(bounds)
+
+        return {
+            'avg_length': length_minutes.mean(),
+            'total_count': total_sessions,
+            'avg_per_user': total_sessions / df[self.userid_col].nunique()
+        }
     
     def _analyze_access_patterns(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Analyze access sequence patterns"""
-        sequences = []
-        
-        for user_id in df[self.userid_col].unique():
-            user_data = df[df[self.userid_col] == user_id].sort_values(self.timestamp_col)
-            door_sequence = user_data[self.doorid_col].tolist()
-            
-            # Find common 2-door sequences
-            for i in range(len(door_sequence) - 1):
-                sequence = (door_sequence[i], door_sequence[i + 1])
-                sequences.append(sequence)
-        
-        if sequences:
-            sequence_counts = pd.Series(sequences).value_counts()
-            return {
-                'sequences': sequence_counts.head(10).to_dict(),
-                'unique_patterns': len(sequence_counts)
-            }
+        columns = self._build_event_columns(df)
+        has_user = columns.user_codes >= 0
+        user_codes = columns.user_codes[has_user]
+        # Shift door codes by one so a missing door (-1) still packs as an unsigned 0
+        door_codes = (columns.door_codes[has_user] + 1).astype(np.uint64)
+
+        # Order events by user, then time (missing timestamps last, as sort_values puts them)
+        if self.timestamp_col in df.columns:
+            ts_values = df[self.timestamp_col].array.asi8[has_user].copy()
+            ts_values[ts_values == np.iinfo(np.int64).min] = np.iinfo(np.int64).max
+            order = np.lexsort((ts_values, user_codes))
         else:
+            order = np.argsort(user_codes, kind='stable')
+        user_codes, door_codes = user_codes[order], door_codes[order]
+
+        # Find common 2-door sequences: each event paired with the user's next one,
+        # packed into a single uint64 (from << 32 | to) so counting hashes one integer per pair
+        same_user = user_codes[:-1] == user_codes[1:]
+        packed = (door_codes[:-1][same_user] << np.uint64(32)) | door_codes[1:][same_user]
+
+        if packed.size == 0:
             return {'sequences': {}, 'unique_patterns': 0}
+
+        pairs, first_seen, counts = np.unique(packed, return_index=True, return_counts=True)
+        # Most frequent first; ties in order of first appearance, as value_counts ranks them
+        top = np.lexsort((first_seen, -counts))[:10]
+        # Code 0 is a missing door: reported as None, as the per-user lists kept it
+        door_labels = np.concatenate([[None], np.asarray(columns.doors, dtype=object)])
+        sequences = {
+            (door_labels[pair >> 32], door_labels[pair & 0xFFFFFFFF]): int(count)
+            for pair, count in zip(pairs[top].tolist(), counts[top].tolist())
+        }
+        return {
+            'sequences': sequences,
+            'unique_patterns': len(pairs)
+        }
     
     def _calculate_device_trends(self, df: pd.DataFrame) -> Dict[str, str]:
         """Calculate device usage trends"""
         trends = {}
         
         # Calculate trend for each device over the last week
-        week_ago = datetime.now() - timedelta(days=7)
-        recent_data = df[df[self.timestamp_col] >= week_ago]
+        week_ago = pd.Timestamp(datetime.now() - timedelta(days=7))
+        recent_data = self._slice_time_range(df, week_ago)
         
         if recent_data.empty:
             return trends
         
-        device_daily_counts = recent_data.groupby([
-            recent_data[self.timestamp_col].dt.date,
-            self.doorid_col
-        ]).size().unstack(fill_value=0)
-        
-        for device in device_daily_counts.columns:
-            device_series = device_daily_counts[device]
-            slope = self._calculate_trend_slope(device_series)
-            
-            if slope > 0.5:
-                trends[device] = "📈 Increasing"
-            elif slope < -0.5:
-                trends[device] = "📉 Decreasing"
-            else:
-                trends[device] = "📊 Stable"
+        # Bucket events into a (days x devices) count matrix keyed on integer codes
+        door_codes, devices = pd.factorize(recent_data[self.doorid_col], sort=True)
+        has_door = door_codes >= 0
+        if not has_door.any():
+            return trends
+        _, day_index = np.unique(_day_numbers(recent_data[self.timestamp_col])[has_door], return_inverse=True)
+        n_days = day_index.max() + 1
+        daily = np.bincount(
+            day_index * len(devices) + door_codes[has_door], minlength=n_days * len(devices)
+        ).reshape(n_days, len(devices)).astype(np.float64)
+        # Devices with no events in the window (unused categories) are left out, as in a groupby
+        seen = daily.any(axis=0)
+        if not seen.all():
+            daily, devices = daily[:, seen], devices[seen]
         
+        # Fit every device's slope at once: one (days,) @ (days, devices) product.
+        # Row-major days x devices keeps both axis-0 reductions on stride-1 rows.
+        daily = np.ascontiguousarray(daily)
+        n = daily.shape[0]
+        if n < 2:
+            slopes = np.zeros(daily.shape[1])
+        else:
+            sx = n * (n - 1) / 2
+            sxx = n * (n - 1) * (2 * n - 1) / 6
+            sxy = np.arange(n, dtype=np.float64) @ daily
+            slopes = (n * sxy - sx * daily.sum(axis=0)) / (n * sxx - sx * sx)
+
+        labels = np.select(
+            [slopes > 0.5, slopes < -0.5],
+            [_TREND_INCREASING, _TREND_DECREASING],
+            default=_TREND_STABLE
+        )
+        trends = dict(zip(devices.tolist(), labels.tolist()))
+
         return trends
     
     def _analyze_device_security(self, device_attrs: pd.DataFrame) -> Dict[str, Any]:
         """Analyze device security configuration"""
         security_analysis = {}
+        has_column = device_attrs.columns.__contains__
         
-        if 'SecurityLevel' in device_attrs.columns:
-            security_counts = device_attrs['SecurityLevel'].value_counts()
+        security_counts = self._security_level_counts(device_attrs)
+        if security_counts is not None:
             security_analysis['level_distribution'] = security_counts.to_dict()
             
-        if 'IsOfficialEntrance' in device_attrs.columns:
-            entrance_count = device_attrs['IsOfficialEntrance'].sum()
+        if has_column('IsOfficialEntrance'):
+            entrance_count = device_attrs['IsOfficialEntrance'].to_numpy(dtype=bool, na_value=False).sum()
             security_analysis['entrance_devices'] = int(entrance_count)
             
-        if 'IsStaircase' in device_attrs.columns:
-            stair_count = device_attrs['IsStaircase'].sum()
+        if has_column('IsStaircase'):
+            stair_count = device_attrs['IsStaircase'].to_numpy(dtype=bool, na_value=False).sum()
             security_analysis['stairway_devices'] = int(stair_count)
         
         return security_analysis
     
+    def _security_level_counts(self, device_attrs: pd.DataFrame) -> Optional[pd.Series]:
+        """SecurityLevel value counts, computed once per device_attrs frame"""
+        if 'SecurityLevel' not in device_attrs.columns:
+            return None
+        
+        cached = self._security_counts
+        if cached is not None and cached[0] is device_attrs and cached[1] == len(device_attrs):
+            return cached[2]
+        
+        security_counts = device_attrs['SecurityLevel'].value_counts()
+        self._security_counts = (device_attrs, len(device_attrs), security_counts)
+        return security_counts
+    
     def _calculate_compliance_score(self, security_counts: pd.Series, total_devices: int) -> float:
         """Calculate security compliance score"""
         if total_devices == 0:
@@ -336,16 +549,27 @@ class EnhancedDataProcessor:
         
         # Calculate denied access rate if available
         if self.eventtype_col in df.columns:
-            denied_events = df[df[self.eventtype_col].str.contains('DENIED|FAILED', case=False, na=False)]
+            columns = self._build_event_columns(df)
+            denied_events = self._count_denied_events(columns.event_codes, columns.event_types)
             total_events = len(df)
             
             if total_events > 0:
-                denial_rate = (len(denied_events) / total_events) * 100
+                denial_rate = (denied_events / total_events) * 100
                 effectiveness['denial_rate'] = round(denial_rate, 2)
                 effectiveness['access_success_rate'] = round(100 - denial_rate, 2)
         
         return effectiveness
     
+    def _count_denied_events(self, event_codes: np.ndarray, event_types: pd.Index) -> int:
+        """Count denied/failed events, matching each distinct event type only once"""
+        if len(event_types) == 0:
+            return 0
+        
+        # The substring match runs over the handful of distinct labels, not every row
+        denied_labels = event_types.astype(str).str.contains('DENIED|FAILED', case=False)
+        label_counts = self._count_codes(event_codes, event_types).to_numpy()
+        return int(label_counts[np.asarray(denied_labels, dtype=bool)].sum())
+    
     def _get_default_temporal_patterns(self) -> Dict[str, Any]:
         """Get default temporal patterns structure"""
         return {
@@ -414,7 +638,7 @@ class EnhancedExportManager:
                 raise ValueError(f"Unsupported format: {format}")
                 
         except Exception as e:
-            logger.error(f"Export error: {e}")
+            logger.error("Export error: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -436,23 +660,39 @@ class EnhancedExportManager:
     
     def _export_excel_report(self, stats_data: Dict[str, Any]) -> Dict[str, Any]:
         """Export Excel report"""
+        tmp_path = None
         try:
-            # Create Excel workbook with multiple sheets
-            output = io.BytesIO()
+            import xlsxwriter
+            
+            # Build the workbook on disk: constant_memory flushes each row as it is written
+            with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as tmp:
+                tmp_path = tmp.name
             
-            with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
+            workbook = xlsxwriter.Workbook(tmp_path, {
+                'constant_memory': True,
+                'default_date_format': 'yyyy-mm-dd hh:mm:ss'
+            })
+            try:
                 # Summary sheet
-                summary_df = pd.DataFrame([stats_data])
-                summary_df.to_excel(writer, sheet_name='Summary', index=False)
+                summary_sheet = workbook.add_worksheet('Summary')
+                summary_sheet.write_row(0, 0, [str(key) for key in stats_data])
+                summary_sheet.write_row(1, 0, [self._excel_cell_value(value) for value in stats_data.values()])
                 
                 # Additional sheets for detailed data
                 if 'hourly_distribution' in stats_data:
-                    hourly_df = pd.DataFrame(list(stats_data['hourly_distribution'].items()), 
-                                           columns=['Hour', 'Events'])
-                    hourly_df.to_excel(writer, sheet_name='Hourly_Patterns', index=False)
+                    hourly_sheet = workbook.add_worksheet('Hourly_Patterns')
+                    hourly_sheet.write_row(0, 0, ['Hour', 'Events'])
+                    for row, (hour, events) in enumerate(stats_data['hourly_distribution'].items(), start=1):
+                        hourly_sheet.write_row(row, 0, [self._excel_cell_value(hour), self._excel_cell_value(events)])
+            finally:
+                workbook.close()
             
-            output.seek(0)
-            encoded_content = base64.b64encode(output.read()).decode('utf-8')
+            # Encode in 48KB chunks (a multiple of 3, so chunks concatenate without padding)
+            encoded_chunks = []
+            with open(tmp_path, 'rb') as workbook_file:
+                for chunk in iter(lambda: workbook_file.read(48 * 1024), b''):
+                    encoded_chunks.append(base64.b64encode(chunk).decode('ascii'))
+            encoded_content = ''.join(encoded_chunks)
             
             return {
                 'success': True,
@@ -463,21 +703,45 @@ class EnhancedExportManager:
             }
             
         except Exception as e:
-            logger.error(f"Excel export error: {e}")
+            logger.error("Excel export error: %s", e)
             return {
                 'success': False,
                 'error': str(e),
                 'format': 'Excel'
             }
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def _excel_cell_value(self, value: Any) -> Any:
+        """Coerce a stats value to something xlsxwriter can write, as to_excel would"""
+        if isinstance(value, np.generic):
+            value = value.item()
+        if isinstance(value, pd.Timestamp):
+            value = value.to_pydatetime() if not pd.isna(value) else None
+        if value is None or value is pd.NA or (isinstance(value, float) and np.isnan(value)):
+            return None
+        if isinstance(value, datetime) and value.tzinfo is not None:
+            return value.isoformat()
+        if isinstance(value, (str, bool, int, float, datetime)):
+            return value
+        return str(value)
     
     def _export_json_report(self, stats_data: Dict[str, Any]) -> Dict[str, Any]:
         """Export JSON report"""
         try:
-            # Clean data for JSON serialization
-            clean_data = self._clean_data_for_json(stats_data)
-            
-            json_content = json.dumps(clean_data, indent=2, default=str)
-            encoded_content = base64.b64encode(json_content.encode('utf-8')).decode('utf-8')
+            if orjson is not None:
+                # orjson handles numpy scalars, NaN and datetimes natively in one pass
+                json_bytes = orjson.dumps(
+                    stats_data,
+                    default=self._json_default,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                )
+            else:
+                # Clean data for JSON serialization
+                clean_data = self._clean_data_for_json(stats_data)
+                json_bytes = json.dumps(clean_data, indent=2, default=str).encode('utf-8')
+            encoded_content = base64.b64encode(json_bytes).decode('ascii')
             
             return {
                 'success': True,
@@ -488,7 +752,7 @@ class EnhancedExportManager:
             }
             
         except Exception as e:
-            logger.error(f"JSON export error: {e}")
+            logger.error("JSON export error: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -516,7 +780,7 @@ class EnhancedExportManager:
             }
             
         except Exception as e:
-            logger.error(f"CSV export error: {e}")
+            logger.error("CSV export error: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -549,6 +813,14 @@ class EnhancedExportManager:
         
         return "\n".join(report_lines)
     
+    def _json_default(self, obj: Any) -> Any:
+        """orjson fallback for the pandas scalars it does not know"""
+        if isinstance(obj, pd.Timestamp) and not pd.isna(obj):
+            return obj.isoformat()
+        if obj is pd.NaT or obj is pd.NA:
+            return None
+        return str(obj)
+    
     def _clean_data_for_json(self, data: Any) -> Any:
         """Clean data for JSON serialization"""
         if isinstance(data, dict):
@@ -566,14 +838,20 @@ class EnhancedExportManager:
     
     def _flatten_dict(self, d: Dict[str, Any], parent_key: str = '', sep: str = '_') -> Dict[str, Any]:
         """Flatten nested dictionary"""
-        items = []
-        for k, v in d.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            if isinstance(v, dict):
-                items.extend(self._flatten_dict(v, new_key, sep=sep).items())
+        flat = {}
+        # Stack of (prefix, items iterator) keeps the depth-first key order without recursion
+        stack = [(parent_key, iter(d.items()))]
+        while stack:
+            prefix, items = stack[-1]
+            for k, v in items:
+                new_key = f"{prefix}{sep}{k}" if prefix else k
+                if isinstance(v, dict):
+                    stack.append((new_key, iter(v.items())))
+                    break
+                flat[new_key] = v
             else:
-                items.append((new_key, v))
-        return dict(items)
+                stack.pop()
+        return flat
 
 
 class EnhancedAnomalyDetector:
@@ -582,38 +860,43 @@ class EnhancedAnomalyDetector:
     def __init__(self):
         self.detection_methods = ['statistical', 'time_based', 'pattern_based']
         
-    def detect_anomalies(self, df: pd.DataFrame, stats_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Detect various types of anomalies"""
+    def detect_anomalies(self, df: pd.DataFrame, stats_data: Dict[str, Any],
+                         known_devices: Optional[Iterable[Any]] = None) -> List[Dict[str, Any]]:
+        """Detect various types of anomalies; known_devices is the roster checked for silent doors"""
         anomalies = []
+        # One timestamp for the whole run; every anomaly found in it shares it
+        detected_at = datetime.now().isoformat()
         
         try:
             # Statistical anomalies
-            stat_anomalies = self._detect_statistical_anomalies(stats_data)
+            stat_anomalies = self._detect_statistical_anomalies(stats_data, detected_at)
             anomalies.extend(stat_anomalies)
             
             # Time-based anomalies
             if df is not None and not df.empty:
-                time_anomalies = self._detect_time_anomalies(df)
+                time_anomalies = self._detect_time_anomalies(df, detected_at)
                 anomalies.extend(time_anomalies)
                 
                 # Pattern-based anomalies
-                pattern_anomalies = self._detect_pattern_anomalies(df)
+                pattern_anomalies = self._detect_pattern_anomalies(df, detected_at, known_devices)
                 anomalies.extend(pattern_anomalies)
             
         except Exception as e:
-            logger.error(f"Anomaly detection error: {e}")
+            logger.error("Anomaly detection error: %s", e)
             anomalies.append({
                 'type': 'detection_error',
                 'severity': 'low',
                 'message': f"Error during anomaly detection: {str(e)}",
-                'timestamp': datetime.now().isoformat()
+                'timestamp': detected_at
             })
         
         return anomalies
     
-    def _detect_statistical_anomalies(self, stats_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _detect_statistical_anomalies(self, stats_data: Dict[str, Any],
+                                      detected_at: Optional[str] = None) -> List[Dict[str, Any]]:
         """Detect statistical anomalies"""
         anomalies = []
+        detected_at = detected_at or datetime.now().isoformat()
         
         # Check for unusually high peak activity
         peak_events = stats_data.get('peak_hour_events', 0)
@@ -624,7 +907,7 @@ class EnhancedAnomalyDetector:
                 'message': f"Unusually high peak activity: {peak_events} events",
                 'value': peak_events,
                 'threshold': 1000,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': detected_at
             })
         
         # Check compliance score
@@ -636,7 +919,7 @@ class EnhancedAnomalyDetector:
                 'message': f"Low security compliance score: {compliance_score}%",
                 'value': compliance_score,
                 'threshold': 50,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': detected_at
             })
         
         # Check for inactive devices
@@ -649,26 +932,37 @@ class EnhancedAnomalyDetector:
                 'message': f"Low device activity: only {devices_today}/{total_devices} devices active today",
                 'value': devices_today / total_devices,
                 'threshold': 0.5,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': detected_at
             })
         
         return anomalies
     
-    def _detect_time_anomalies(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def _detect_time_anomalies(self, df: pd.DataFrame, detected_at: Optional[str] = None) -> List[Dict[str, Any]]:
         """Detect time-based anomalies"""
         anomalies = []
+        detected_at = detected_at or datetime.now().isoformat()
         
         try:
             timestamp_col = REQUIRED_INTERNAL_COLUMNS['Timestamp']
             if timestamp_col not in df.columns:
                 return anomalies
             
+            # One contiguous int64 buffer of wall-clock nanoseconds; hour and weekday are
+            # integer arithmetic on it rather than two separate datetime field extractions
+            timestamps = df[timestamp_col]
+            if timestamps.dt.tz is not None:
+                timestamps = timestamps.dt.tz_localize(None)
+            nanos = timestamps.to_numpy(dtype='datetime64[ns]').view(np.int64)
+            nanos = nanos[nanos != _NAT_DAY]  # NaT has the same int64 sentinel at any unit
+            
             # Check for unusual after-hours activity
-            night_events = df[df[timestamp_col].dt.hour.isin([22, 23, 0, 1, 2, 3, 4, 5])]
+            hours = nanos // 3_600_000_000_000 % 24
+            hour_bins = np.bincount(hours, minlength=24)
+            night_events = hour_bins[[22, 23, 0, 1, 2, 3, 4, 5]].sum()
             total_events = len(df)
             
             if total_events > 0:
-                night_ratio = len(night_events) / total_events
+                night_ratio = night_events / total_events
                 if night_ratio > 0.2:  # More than 20% of events at night
                     anomalies.append({
                         'type': 'unusual_night_activity',
@@ -676,13 +970,14 @@ class EnhancedAnomalyDetector:
                         'message': f"High night-time activity: {night_ratio:.1%} of events",
                         'value': night_ratio,
                         'threshold': 0.2,
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': detected_at
                     })
             
             # Check for weekend activity
-            weekend_events = df[df[timestamp_col].dt.dayofweek.isin([5, 6])]
+            weekdays = (nanos // 86_400_000_000_000 + 3) % 7  # the epoch fell on a Thursday
+            weekend_events = np.bincount(weekdays, minlength=7)[5:].sum()
             if total_events > 0:
-                weekend_ratio = len(weekend_events) / total_events
+                weekend_ratio = weekend_events / total_events
                 if weekend_ratio > 0.3:  # More than 30% on weekends
                     anomalies.append({
                         'type': 'high_weekend_activity',
@@ -690,17 +985,19 @@ class EnhancedAnomalyDetector:
                         'message': f"High weekend activity: {weekend_ratio:.1%} of events",
                         'value': weekend_ratio,
                         'threshold': 0.3,
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': detected_at
                     })
             
         except Exception as e:
-            logger.error(f"Time anomaly detection error: {e}")
+            logger.error("Time anomaly detection error: %s", e)
         
         return anomalies
     
-    def _detect_pattern_anomalies(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def _detect_pattern_anomalies(self, df: pd.DataFrame, detected_at: Optional[str] = None,
+                                  known_devices: Optional[Iterable[Any]] = None) -> List[Dict[str, Any]]:
         """Detect pattern-based anomalies"""
         anomalies = []
+        detected_at = detected_at or datetime.now().isoformat()
         
         try:
             doorid_col = REQUIRED_INTERNAL_COLUMNS['DoorID']
@@ -710,42 +1007,51 @@ class EnhancedAnomalyDetector:
                 return anomalies
             
             # Check for users with unusually high activity
-            user_counts = df[userid_col].value_counts()
+            user_counts = df[userid_col].value_counts(sort=False)
             mean_activity = user_counts.mean()
             std_activity = user_counts.std()
             
             if std_activity > 0:
                 threshold = mean_activity + 3 * std_activity
-                high_activity_users = user_counts[user_counts > threshold]
+                high_activity_users = user_counts[user_counts > threshold].sort_values(ascending=False)
                 
-                for user, count in high_activity_users.items():
-                    anomalies.append({
+                anomalies.extend([
+                    {
                         'type': 'high_user_activity',
                         'severity': 'medium',
                         'message': f"User {user} has unusually high activity: {count} events",
                         'user_id': user,
                         'value': count,
                         'threshold': threshold,
-                        'timestamp': datetime.now().isoformat()
-                    })
+                        'timestamp': detected_at
+                    }
+                    for user, count in high_activity_users.to_dict().items()
+                ])
             
-            # Check for devices with no activity
-            device_counts = df[doorid_col].value_counts()
-            if len(device_counts) > 0 and device_counts.min() == 0:
-                inactive_devices = device_counts[device_counts == 0]
-                for device in inactive_devices.index:
-                    anomalies.append({
+            # Check for devices with no activity: roster entries never seen in the log.
+            # Without an explicit roster, a categorical door column's categories serve as one.
+            doors = df[doorid_col]
+            if known_devices is None and isinstance(doors.dtype, pd.CategoricalDtype):
+                known_devices = doors.cat.categories
+            if known_devices is not None:
+                # Only membership matters: a hash-based unique, no per-device counts or sort
+                observed = set(pd.unique(doors).tolist())
+                inactive_devices = [device for device in known_devices if device not in observed]
+                anomalies.extend([
+                    {
                         'type': 'inactive_device',
                         'severity': 'low',
                         'message': f"Device {device} has no recorded activity",
                         'device_id': device,
                         'value': 0,
                         'threshold': 1,
-                        'timestamp': datetime.now().isoformat()
-                    })
+                        'timestamp': detected_at
+                    }
+                    for device in inactive_devices
+                ])
             
         except Exception as e:
-            logger.error(f"Pattern anomaly detection error: {e}")
+            logger.error("Pattern anomaly detection error: %s", e)
         
         return anomalies
 
@@ -774,6 +1080,15 @@ def format_large_number(num: Union[int, float]) -> str:
     else:
         return str(int(num))
 
+def format_large_numbers_vec(values: Union[pd.Series, np.ndarray, List[float]]) -> np.ndarray:
+    """Format a whole array of numbers like format_large_number; the suffix branch is picked in NumPy"""
+    a = np.asarray(values, dtype=np.float64)
+    conditions = [a >= 1_000_000, a >= 1_000]
+    scaled = np.select(conditions, [a / 1_000_000, a / 1_000], default=a)
+    suffixes = np.select(conditions, ['M', 'K'], default='')
+    return np.array([f"{v:.1f}{s}" if s else str(int(v)) for v, s in zip(scaled.tolist(), suffixes.tolist())],
+                    dtype=str)
+
 def calculate_percentage_change(current: float, previous: float) -> Tuple[float, str]:
     """Calculate percentage change and return with direction indicator"""
     if previous == 0:
@@ -790,12 +1105,14 @@ def calculate_percentage_change(current: float, previous: float) -> Tuple[float,
 
 def generate_trend_indicator(values: List[float]) -> str:
     """Generate trend indicator from a series of values"""
-    if len(values) < 2:
+    v = np.asarray(values, dtype=np.float64)
+    if v.size < 2:
         return "📊"
     
-    # Simple trend calculation
-    recent_avg = sum(values[-3:]) / min(3, len(values))
-    older_avg = sum(values[:-3]) / max(1, len(values) - 3)
+    # Simple trend calculation: last three values against everything before them
+    # (against the first value when there is nothing before them)
+    recent_avg = v[-3:].mean()
+    older_avg = v[:-3].mean() if v.size > 3 else v[:1].mean()
     
     if recent_avg > older_avg * 1.1:
         return "📈"
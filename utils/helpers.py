@@ -118,4 +118,46 @@ def parse_boolean(value: Any) -> bool:
         return value.lower() in ('true', '1', 'yes', 'on', 'enabled')
     if isinstance(value, (int, float)):
         return bool(value)
-    return False
\ No newline at end of file
+    return False
+
+def enable_response_compression(server) -> bool:
+    """Compress layout JSON, assets and callback responses when Flask-Compress is installed"""
+    try:
+        from flask_compress import Compress
+    except ImportError:
+        return False
+    
+    server.config.setdefault('COMPRESS_MIMETYPES', [
+        'application/json', 'text/html', 'text/css', 'application/javascript'
+    ])
+    server.config.setdefault('COMPRESS_ALGORITHM', ['br', 'gzip'])
+    server.config.setdefault('COMPRESS_LEVEL', 6)
+    server.config.setdefault('COMPRESS_MIN_SIZE', 500)
+    Compress(server)
+    return True
+
+def cache_layout_response(app) -> bool:
+    """Serve a static app.layout from bytes serialized once, with an ETag for 304s"""
+    endpoint = app.config.routes_pathname_prefix + '_dash-layout'
+    serve_layout = app.server.view_functions.get(endpoint)
+    # Layout functions are re-evaluated per page load by design; leave them alone
+    if serve_layout is None or callable(app.layout):
+        return False
+    
+    import flask
+    cached = {}
+    
+    def serve_cached_layout():
+        if 'body' not in cached:
+            body = serve_layout().get_data()
+            cached['etag'] = hashlib.md5(body).hexdigest()
+            cached['body'] = body
+        if cached['etag'] in flask.request.if_none_match:
+            response = flask.Response(status=304)
+        else:
+            response = flask.Response(cached['body'], mimetype='application/json')
+        response.set_etag(cached['etag'])
+        return response
+    
+    app.server.view_functions[endpoint] = serve_cached_layout
+    return True
\ No newline at end of file
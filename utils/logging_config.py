@@ -4,15 +4,35 @@
 Simple logging configuration that works without external dependencies
 """
 
+import atexit
 import logging
+import queue
 import sys
 import os
-from datetime import datetime
+import time
+from logging.handlers import QueueHandler, QueueListener
 
 # ============================================================================
 # SIMPLE LOGGER SETUP
 # ============================================================================
 
+# Set once logging has been configured, explicitly or by the first get_logger call
+_CONFIGURED = False
+
+# Background thread draining queued records to the log file (None without a log file)
+_file_listener = None
+
+def _stop_file_listener():
+    """Flush and close the queued file handler, if one is running"""
+    global _file_listener
+    if _file_listener is not None:
+        _file_listener.stop()
+        for handler in _file_listener.handlers:
+            handler.close()
+        _file_listener = None
+
+atexit.register(_stop_file_listener)
+
 def setup_application_logging(log_level='INFO', log_file=None):
     """
     Set up application logging with simple configuration
@@ -21,6 +41,8 @@ def setup_application_logging(log_level='INFO', log_file=None):
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
         log_file: Optional log file path
     """
+    global _CONFIGURED, _file_listener
+    _CONFIGURED = True
     
     # Create formatter
     formatter = logging.Formatter(
@@ -34,6 +56,7 @@ def setup_application_logging(log_level='INFO', log_file=None):
     
     # Clear existing handlers
     root_logger.handlers.clear()
+    _stop_file_listener()
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -52,7 +75,12 @@ def setup_application_logging(log_level='INFO', log_file=None):
             file_handler = logging.FileHandler(log_file)
             file_handler.setFormatter(formatter)
             file_handler.setLevel(getattr(logging, log_level.upper(), logging.INFO))
-            root_logger.addHandler(file_handler)
+            
+            # Callers only enqueue records; a listener thread does the file writes
+            log_queue = queue.SimpleQueue()
+            root_logger.addHandler(QueueHandler(log_queue))
+            _file_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+            _file_listener.start()
             
             print(f"📝 Logging to file: {log_file}")
             
@@ -60,6 +88,23 @@ def setup_application_logging(log_level='INFO', log_file=None):
             print(f"⚠️ Could not set up file logging: {e}")
     
     print(f"📊 Logging configured - Level: {log_level}")
+    logging.getLogger(__name__).info("✅ Logging configuration loaded")
+
+def _ensure_configured():
+    """Configure logging on first use instead of at import (no-op once configured)"""
+    if _CONFIGURED:
+        return
+    
+    try:
+        # Try to set up proper logging
+        setup_application_logging()
+    except Exception as e:
+        # Fall back to basic logging
+        print(f"⚠️ Logging setup failed: {e}")
+        try:
+            setup_simple_console_logging()
+        except Exception:
+            print("⚠️ Even basic logging failed - using print statements")
 
 def get_logger(name=None):
     """
@@ -71,6 +116,8 @@ def get_logger(name=None):
     Returns:
         Logger instance
     """
+    _ensure_configured()
+    
     if name is None:
         name = __name__
     
@@ -100,29 +147,39 @@ class SimpleLogger:
     Simple logger class for when logging module isn't working
     """
     
+    # [epoch second, its '%H:%M:%S' text]: one strftime per second, shared by all instances
+    _ts_cache = [None, '']
+    
     def __init__(self, name="app"):
         self.name = name
         self.enabled = True
     
-    def _log(self, level, message):
+    def _log(self, level, message, *args):
         if self.enabled:
-            timestamp = datetime.now().strftime('%H:%M:%S')
-            print(f"{timestamp} - {level} - {self.name} - {message}")
-    
-    def info(self, message):
-        self._log("INFO", message)
-    
-    def debug(self, message):
-        self._log("DEBUG", message)
-    
-    def warning(self, message):
-        self._log("WARNING", message)
-    
-    def error(self, message):
-        self._log("ERROR", message)
-    
-    def critical(self, message):
-        self._log("CRITICAL", message)
+            # logging-style lazy %-formatting: only messages that are emitted get formatted
+            if args:
+                message = message % args
+            second = int(time.time())
+            cache = SimpleLogger._ts_cache
+            if cache[0] != second:
+                cache[1] = time.strftime('%H:%M:%S', time.localtime(second))
+                cache[0] = second
+            sys.stdout.write(f"{cache[1]} - {level} - {self.name} - {message}\n")
+    
+    def info(self, message, *args):
+        self._log("INFO", message, *args)
+    
+    def debug(self, message, *args):
+        self._log("DEBUG", message, *args)
+    
+    def warning(self, message, *args):
+        self._log("WARNING", message, *args)
+    
+    def error(self, message, *args):
+        self._log("ERROR", message, *args)
+    
+    def critical(self, message, *args):
+        self._log("CRITICAL", message, *args)
 
 # ============================================================================
 # SAFE LOGGER FACTORY
@@ -143,26 +200,6 @@ def get_safe_logger(name=None):
     except Exception:
         return SimpleLogger(name or "app")
 
-# ============================================================================
-# INITIALIZATION
-# ============================================================================
-
-# Set up basic logging on import
-try:
-    # Try to set up proper logging
-    setup_application_logging()
-except Exception as e:
-    # Fall back to basic logging
-    print(f"⚠️ Logging setup failed: {e}")
-    try:
-        setup_simple_console_logging()
-    except Exception:
-        print("⚠️ Even basic logging failed - using print statements")
-
-# Create default logger
-logger = get_safe_logger(__name__)
-logger.info("✅ Logging configuration loaded")
-
 # ============================================================================
 # EXPORTS
 # ============================================================================